@@ -5,24 +5,26 @@ A local-only AI-powered emotional journaling platform
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+import io
+import json
 import os
 import sys
+import threading
+from collections import Counter
+from itertools import chain
 
 # Add utils to path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from utils.data_manager import DataManager
-from utils.sentiment_analyzer_lite import analyze_sentiment, get_mood_emoji, get_mood_color
-from utils.visualizations import (
-    create_mood_trend_chart,
-    create_emotion_distribution_chart,
-    create_word_cloud,
-    create_day_of_week_chart,
-    create_sentiment_distribution_chart,
-    create_calendar_heatmap,
-    get_summary_stats
-)
+from utils.mood import get_mood_colors, get_mood_emoji, get_mood_emojis
+
+# Visualizations and sentiment analysis are imported by the pages that use them
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from utils.visualizations import PreparedJournal
 
 # Page configuration
 st.set_page_config(
@@ -70,10 +72,27 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize session state
-if 'data_manager' not in st.session_state:
-    st.session_state.data_manager = DataManager()
 
+@st.cache_resource
+def _get_data_manager() -> DataManager:
+    """Shared DataManager for all sessions"""
+    return DataManager()
+
+
+def _entries_version() -> Tuple[int, int]:
+    """
+    Version of the stored entries, the key for every cached loader and chart
+
+    Read from the shared DataManager on each rerun, so it changes for all
+    sessions when any session (or another process) saves or deletes entries
+
+    Returns:
+        Opaque version tuple from DataManager.get_data_version
+    """
+    return _get_data_manager().get_data_version()
+
+
+# Initialize session state
 if 'current_entry' not in st.session_state:
     st.session_state.current_entry = ""
 
@@ -81,7 +100,234 @@ if 'selected_mood' not in st.session_state:
     st.session_state.selected_mood = None
 
 # Get data manager
-dm = st.session_state.data_manager
+dm = _get_data_manager()
+
+
+# Columns added by the cached loaders that are not stored in the database
+_DERIVED_COLUMNS = ['emotions_str', 'keywords_str', 'mood_emoji', 'mood_color']
+
+
+def _add_display_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Precompute display strings for the list columns and the mood emoji
+    and color for each entry
+
+    Args:
+        df: DataFrame with entries
+
+    Returns:
+        The same DataFrame with emotions_str, keywords_str, mood_emoji and
+        mood_color columns
+    """
+    if not df.empty:
+        df['emotions_str'] = df['detected_emotions'].map(lambda x: ', '.join(x) if x else '')
+        df['keywords_str'] = df['keywords'].map(lambda x: ', '.join(x) if x else '')
+
+        scores = df['ai_sentiment_score'].to_numpy(dtype=float)
+        df['mood_emoji'] = get_mood_emojis(scores)
+        df['mood_color'] = get_mood_colors(scores)
+
+    return df
+
+
+# Cached loaders and charts are keyed on the entries version, which changes
+# with every save or delete, so each keeps only the current and previous
+# version instead of every frame and figure since startup
+@st.cache_data(max_entries=2, show_spinner=False)
+def _load_entries(version: Tuple[int, int]) -> pd.DataFrame:
+    """
+    Load all entries, cached until the entries version changes
+
+    Args:
+        version: Entries version, bumped whenever an entry is saved or deleted
+
+    Returns:
+        DataFrame with all entries
+    """
+    return _add_display_columns(_get_data_manager().get_all_entries())
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _load_recent_entries(version: Tuple[int, int], limit: int = 10) -> pd.DataFrame:
+    """
+    Load the most recent entries, cached until the entries version changes
+
+    Args:
+        version: Entries version
+        limit: Number of entries to retrieve
+
+    Returns:
+        DataFrame with recent entries
+    """
+    return _add_display_columns(_get_data_manager().get_recent_entries(limit=limit))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _prepared_journal(version: Tuple[int, int]) -> "PreparedJournal":
+    """
+    Chart-ready entry arrays, built once per entries version and shared by
+    all charts (the arrays are read-only)
+
+    Args:
+        version: Entries version
+
+    Returns:
+        PreparedJournal with all entries
+    """
+    from utils.visualizations import prepare_journal
+
+    return prepare_journal(_load_entries(version))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _entries_overview(version: Tuple[int, int]) -> Tuple[int, Optional[Tuple[date, date]]]:
+    """
+    Entry count and date range, read from SQLite without loading entries
+
+    Args:
+        version: Entries version
+
+    Returns:
+        Tuple of (total_entries, (first_date, last_date) or None)
+    """
+    dm = _get_data_manager()
+    return dm.count_entries(), dm.get_date_range()
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _summary_stats(version: Tuple[int, int], today: date) -> Dict:
+    """
+    Dashboard summary statistics, cached per entries version and day
+
+    Args:
+        version: Entries version
+        today: Current date, so day-based stats refresh at midnight
+
+    Returns:
+        Dictionary with statistics
+    """
+    from utils.visualizations import get_summary_stats
+
+    return get_summary_stats(_prepared_journal(version))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _journal_stats(version: Tuple[int, int], today: date) -> Dict:
+    """
+    Streak and consistency statistics, cached per entries version and day
+
+    Args:
+        version: Entries version
+        today: Current date, so day-based stats refresh at midnight
+
+    Returns:
+        Dictionary with statistics
+    """
+    return _get_data_manager().get_stats()
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _weekly_summary(version: Tuple[int, int], today: date) -> Optional[Tuple[float, int, str]]:
+    """
+    Summarize the last 7 days of entries, cached per entries version and day
+
+    Args:
+        version: Entries version
+        today: Current date, so the 7 day window moves at midnight
+
+    Returns:
+        Tuple of (avg_sentiment, num_entries, top_keyword) or None if there
+        are no entries in the last 7 days
+    """
+    df = _load_entries(version)
+    df_7d = df[df['timestamp'] >= datetime.now() - timedelta(days=7)]
+
+    if df_7d.empty:
+        return None
+
+    avg_sentiment = df_7d['ai_sentiment_score'].mean()
+    num_entries = len(df_7d)
+
+    # Count keywords in a single pass
+    top_keywords = Counter(
+        chain.from_iterable(keywords for keywords in df_7d['keywords'] if keywords)
+    ).most_common(3)
+    top_keyword = top_keywords[0][0] if top_keywords else "N/A"
+
+    return avg_sentiment, num_entries, top_keyword
+
+
+# Room for every time range of the current and previous entries version
+@st.cache_data(max_entries=8, show_spinner=False)
+def _mood_trend_chart(version: Tuple[int, int], today: date, days: Optional[int]) -> Optional["go.Figure"]:
+    """Mood trend chart, cached per entries version, day and time range (None if empty)"""
+    from utils.visualizations import create_mood_trend_chart
+
+    return create_mood_trend_chart(_prepared_journal(version), days=days, render_empty=False)
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _emotion_distribution_chart(version: Tuple[int, int]) -> Optional["go.Figure"]:
+    """Emotion distribution chart, cached per entries version (None if empty)"""
+    from utils.visualizations import create_emotion_distribution_chart
+
+    return create_emotion_distribution_chart(_prepared_journal(version), render_empty=False)
+
+
+@st.cache_data(ttl=3600, max_entries=2, show_spinner=False)
+def _word_cloud(version: Tuple[int, int]) -> Optional[str]:
+    """Base64 word cloud PNG, cached per entries version"""
+    from utils.visualizations import create_word_cloud
+
+    return create_word_cloud(_prepared_journal(version))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _day_of_week_chart(version: Tuple[int, int]) -> "go.Figure":
+    """Mood by day of week chart, cached per entries version"""
+    from utils.visualizations import create_day_of_week_chart
+
+    return create_day_of_week_chart(_prepared_journal(version))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _sentiment_distribution_chart(version: Tuple[int, int]) -> "go.Figure":
+    """Sentiment distribution chart, cached per entries version"""
+    from utils.visualizations import create_sentiment_distribution_chart
+
+    return create_sentiment_distribution_chart(_prepared_journal(version))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _calendar_heatmap(version: Tuple[int, int], today: date) -> "go.Figure":
+    """Activity calendar, cached per entries version and day"""
+    from utils.visualizations import create_calendar_heatmap
+
+    return create_calendar_heatmap(_prepared_journal(version))
+
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def _analyze(text: str) -> Dict:
+    """Sentiment analysis result, cached by entry text"""
+    from utils.sentiment_analyzer_lite import analyze_sentiment
+
+    return analyze_sentiment(text)
+
+
+@st.cache_resource
+def _warm_up_analyzer() -> threading.Thread:
+    """Warm up the sentiment analyzer in the background, once per process"""
+    from utils.sentiment_analyzer_lite import warm_up
+
+    thread = threading.Thread(target=warm_up, daemon=True)
+    thread.start()
+    return thread
+
+
+def _clear_entry_form():
+    """Reset the new entry form widgets"""
+    st.session_state.current_entry = ""
+    st.session_state.selected_mood = None
 
 
 def render_new_entry_page():
@@ -90,66 +336,56 @@ def render_new_entry_page():
 
     st.write("Take a moment to reflect on your day. Write about your thoughts, feelings, and experiences.")
 
-    # Mood selector (optional)
-    st.markdown("### How are you feeling? (Optional)")
-
-    # Display currently selected mood
-    if st.session_state.selected_mood:
-        col_display, col_clear = st.columns([4, 1])
-        with col_display:
-            st.info(f"Selected mood: {st.session_state.selected_mood}")
-        with col_clear:
-            if st.button("Clear", key="clear_mood"):
-                st.session_state.selected_mood = None
-                st.rerun()
+    # Load the analyzer while the user is writing
+    _warm_up_analyzer()
 
-    col1, col2, col3, col4, col5 = st.columns(5)
+    # Reset the form after a successful save on the previous run
+    if st.session_state.pop('reset_entry_form', False):
+        _clear_entry_form()
 
     moods = {
-        "Very Sad": "😭",
-        "Sad": "😢",
-        "Neutral": "😐",
-        "Happy": "😊",
-        "Very Happy": "😄"
+        "😭": "Very Sad",
+        "😢": "Sad",
+        "😐": "Neutral",
+        "😊": "Happy",
+        "😄": "Very Happy"
     }
 
-    for i, (mood_name, emoji) in enumerate(moods.items()):
-        col = [col1, col2, col3, col4, col5][i]
-        if col.button(f"{emoji} {mood_name}", key=f"mood_{mood_name}", use_container_width=True):
-            st.session_state.selected_mood = emoji
-            st.rerun()
-
-    st.markdown("---")
+    # Mood selection and text only rerun the app when the form is submitted
+    with st.form("entry_form"):
+        # Mood selector (optional)
+        st.markdown("### How are you feeling? (Optional)")
+        selected_mood = st.radio(
+            "Mood",
+            options=list(moods.keys()),
+            format_func=lambda emoji: f"{emoji} {moods[emoji]}",
+            index=None,
+            horizontal=True,
+            key="selected_mood",
+            label_visibility="collapsed"
+        )
 
-    # Entry text area
-    st.markdown("### Your Journal Entry")
-    entry_text = st.text_area(
-        "Write your thoughts here...",
-        value=st.session_state.current_entry,
-        height=300,
-        max_chars=5000,
-        placeholder="Today I felt..."
-    )
+        st.markdown("---")
 
-    # Character counter
-    char_count = len(entry_text)
-    col1, col2 = st.columns([3, 1])
-    with col2:
-        if char_count < 20:
-            st.caption(f"⚠️ {char_count}/5000 characters (minimum 20)")
-        else:
-            st.caption(f"✓ {char_count}/5000 characters")
+        # Entry text area
+        st.markdown("### Your Journal Entry")
+        entry_text = st.text_area(
+            "Write your thoughts here...",
+            height=300,
+            max_chars=5000,
+            placeholder="Today I felt...",
+            key="current_entry"
+        )
+        st.caption("Minimum 20 characters")
 
-    # Buttons
-    col1, col2, col3 = st.columns([1, 1, 3])
+        # Buttons
+        col1, col2, col3 = st.columns([1, 1, 3])
 
-    with col1:
-        submit_button = st.button("Submit Entry", type="primary", use_container_width=True)
+        with col1:
+            submit_button = st.form_submit_button("Submit Entry", type="primary", use_container_width=True)
 
-    with col2:
-        if st.button("Clear", use_container_width=True):
-            st.session_state.current_entry = ""
-            st.rerun()
+        with col2:
+            st.form_submit_button("Clear", on_click=_clear_entry_form, use_container_width=True)
 
     # Handle submission
     if submit_button:
@@ -165,12 +401,12 @@ def render_new_entry_page():
             with st.spinner("Analyzing your entry..."):
                 try:
                     # Analyze sentiment
-                    analysis_result = analyze_sentiment(entry_text)
+                    analysis_result = _analyze(entry_text)
 
                     # Save to database
                     entry_id = dm.save_entry(
                         entry_text=entry_text,
-                        user_selected_mood=st.session_state.selected_mood,
+                        user_selected_mood=selected_mood,
                         ai_sentiment_label=analysis_result['label'],
                         ai_sentiment_score=analysis_result['score'],
                         ai_confidence=analysis_result['confidence'],
@@ -182,7 +418,7 @@ def render_new_entry_page():
                     mood_emoji = get_mood_emoji(analysis_result['score'])
 
                     # Success message
-                    user_mood_msg = f"<p><strong>Your Selected Mood:</strong> {st.session_state.selected_mood}</p>" if st.session_state.selected_mood else ""
+                    user_mood_msg = f"<p><strong>Your Selected Mood:</strong> {selected_mood}</p>" if selected_mood else ""
                     st.markdown(f"""
                     <div class="success-message">
                         <h3>✅ Entry Saved Successfully!</h3>
@@ -194,9 +430,8 @@ def render_new_entry_page():
                     </div>
                     """, unsafe_allow_html=True)
 
-                    # Clear entry and mood
-                    st.session_state.current_entry = ""
-                    st.session_state.selected_mood = None
+                    # Clear entry and mood on the next run
+                    st.session_state.reset_entry_form = True
 
                     # Show success button to navigate
                     if st.button("View Dashboard 📊"):
@@ -210,10 +445,12 @@ def render_new_entry_page():
 
 def render_dashboard_page():
     """Render the dashboard page"""
+    version = _entries_version()
+
     st.markdown('<h1 class="main-header">📊 Dashboard</h1>', unsafe_allow_html=True)
 
     # Get all entries
-    df = dm.get_all_entries()
+    df = _load_entries(version)
 
     if df.empty:
         st.info("👋 Welcome! You haven't created any journal entries yet. Start by writing your first entry!")
@@ -224,7 +461,7 @@ def render_dashboard_page():
 
     # Summary statistics
     st.markdown("### 📈 Summary")
-    stats = get_summary_stats(df)
+    stats = _summary_stats(version, date.today())
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -275,9 +512,12 @@ def render_dashboard_page():
         "All Time": None
     }
 
-    # Mood trend chart
-    fig_trend = create_mood_trend_chart(df, days=days_map[time_range])
-    st.plotly_chart(fig_trend, use_container_width=True)
+    # Mood trend chart, stable keys let reruns update charts in place
+    fig_trend = _mood_trend_chart(version, date.today(), days_map[time_range])
+    if fig_trend is not None:
+        st.plotly_chart(fig_trend, use_container_width=True, key="mood_trend_chart")
+    else:
+        st.info(f"No entries in the {time_range.lower()}")
 
     st.markdown("---")
 
@@ -286,12 +526,15 @@ def render_dashboard_page():
 
     with col1:
         st.markdown("### 🎭 Emotion Distribution")
-        fig_emotions = create_emotion_distribution_chart(df)
-        st.plotly_chart(fig_emotions, use_container_width=True)
+        fig_emotions = _emotion_distribution_chart(version)
+        if fig_emotions is not None:
+            st.plotly_chart(fig_emotions, use_container_width=True, key="emotion_distribution_chart")
+        else:
+            st.info("No emotions detected yet")
 
     with col2:
         st.markdown("### ☁️ Word Cloud")
-        word_cloud_img = create_word_cloud(df)
+        word_cloud_img = _word_cloud(version)
         if word_cloud_img:
             st.image(f"data:image/png;base64,{word_cloud_img}", use_container_width=True)
         else:
@@ -301,20 +544,20 @@ def render_dashboard_page():
 
     # Recent entries
     st.markdown("### 📚 Recent Entries")
-    recent_df = dm.get_recent_entries(limit=10)
+    recent_df = _load_recent_entries(version, limit=10)
 
     if not recent_df.empty:
         for idx, row in recent_df.iterrows():
             with st.expander(
                 f"{row['timestamp'].strftime('%Y-%m-%d %H:%M')} - "
-                f"{get_mood_emoji(row['ai_sentiment_score'])} "
+                f"{row['mood_emoji']} "
                 f"{row['entry_text'][:50]}..."
             ):
                 st.write(f"**Full Entry:**")
                 st.write(row['entry_text'])
                 st.write(f"**Sentiment:** {row['ai_sentiment_label']} ({row['ai_sentiment_score']:.2f})")
-                st.write(f"**Emotions:** {', '.join(row['detected_emotions'])}")
-                st.write(f"**Keywords:** {', '.join(row['keywords'])}")
+                st.write(f"**Emotions:** {row['emotions_str']}")
+                st.write(f"**Keywords:** {row['keywords_str']}")
 
                 if st.button(f"Delete", key=f"delete_{row['id']}"):
                     if dm.delete_entry(row['id']):
@@ -324,9 +567,11 @@ def render_dashboard_page():
 
 def render_insights_page():
     """Render the insights page"""
+    version = _entries_version()
+
     st.markdown('<h1 class="main-header">💡 Insights</h1>', unsafe_allow_html=True)
 
-    df = dm.get_all_entries()
+    df = _load_entries(version)
 
     if df.empty:
         st.info("No data available yet. Start journaling to see insights!")
@@ -336,22 +581,10 @@ def render_insights_page():
     st.markdown("### 📅 Weekly Summary")
 
     # Get last 7 days data
-    now = datetime.now()
-    df_7d = df[df['timestamp'] >= now - timedelta(days=7)]
+    weekly_summary = _weekly_summary(version, date.today())
 
-    if not df_7d.empty:
-        avg_sentiment = df_7d['ai_sentiment_score'].mean()
-        num_entries = len(df_7d)
-
-        # Collect all keywords
-        all_keywords = []
-        for keywords in df_7d['keywords']:
-            if keywords:
-                all_keywords.extend(keywords)
-
-        from collections import Counter
-        top_keywords = Counter(all_keywords).most_common(3)
-        top_keyword = top_keywords[0][0] if top_keywords else "N/A"
+    if weekly_summary:
+        avg_sentiment, num_entries, top_keyword = weekly_summary
 
         sentiment_desc = "positive" if avg_sentiment > 0.3 else "negative" if avg_sentiment < -0.3 else "mixed"
 
@@ -375,21 +608,21 @@ def render_insights_page():
     with col1:
         # Day of week analysis
         st.markdown("#### Mood by Day of Week")
-        fig_dow = create_day_of_week_chart(df)
-        st.plotly_chart(fig_dow, use_container_width=True)
+        fig_dow = _day_of_week_chart(version)
+        st.plotly_chart(fig_dow, use_container_width=True, key="day_of_week_chart")
 
     with col2:
         # Sentiment distribution
         st.markdown("#### Sentiment Distribution")
-        fig_sent = create_sentiment_distribution_chart(df)
-        st.plotly_chart(fig_sent, use_container_width=True)
+        fig_sent = _sentiment_distribution_chart(version)
+        st.plotly_chart(fig_sent, use_container_width=True, key="sentiment_distribution_chart")
 
     st.markdown("---")
 
     # Streak & Consistency
     st.markdown("### 🔥 Streak & Consistency")
 
-    stats = dm.get_stats()
+    stats = _journal_stats(version, date.today())
 
     col1, col2, col3 = st.columns(3)
 
@@ -404,8 +637,8 @@ def render_insights_page():
 
     # Calendar heatmap
     st.markdown("#### Activity Calendar")
-    fig_calendar = create_calendar_heatmap(df)
-    st.plotly_chart(fig_calendar, use_container_width=True)
+    fig_calendar = _calendar_heatmap(version, date.today())
+    st.plotly_chart(fig_calendar, use_container_width=True, key="calendar_heatmap")
 
     st.markdown("---")
 
@@ -439,11 +672,13 @@ def render_insights_page():
 
 def render_all_entries_page():
     """Render the all entries page with filters"""
+    version = _entries_version()
+
     st.markdown('<h1 class="main-header">📚 All Entries</h1>', unsafe_allow_html=True)
 
-    df = dm.get_all_entries()
+    total_entries, date_range = _entries_overview(version)
 
-    if df.empty:
+    if total_entries == 0:
         st.info("No entries yet. Start journaling!")
         return
 
@@ -453,8 +688,7 @@ def render_all_entries_page():
 
         with col1:
             # Date range
-            min_date = df['timestamp'].min().date()
-            max_date = df['timestamp'].max().date()
+            min_date, max_date = date_range
 
             start_date = st.date_input("Start Date", value=min_date, min_value=min_date, max_value=max_date)
             end_date = st.date_input("End Date", value=max_date, min_value=min_date, max_value=max_date)
@@ -471,29 +705,19 @@ def render_all_entries_page():
             # Keyword search
             keyword = st.text_input("Search Keyword", placeholder="Enter keyword...")
 
-    # Apply filters
-    filtered_df = df.copy()
-
-    # Date filter
-    filtered_df = filtered_df[
-        (filtered_df['timestamp'].dt.date >= start_date) &
-        (filtered_df['timestamp'].dt.date <= end_date)
-    ]
-
-    # Sentiment filter
-    if sentiment_filter:
-        filtered_df = filtered_df[filtered_df['ai_sentiment_label'].isin(sentiment_filter)]
-
-    # Keyword filter
-    if keyword:
-        filtered_df = filtered_df[
-            filtered_df['entry_text'].str.contains(keyword, case=False, na=False)
-        ]
+    # Apply filters in the database, only the current page is loaded
+    filters = {
+        'start_date': start_date,
+        'end_date': end_date,
+        'sentiments': sentiment_filter,
+        'keyword': keyword
+    }
+    total_count = dm.count_entries(**filters)
 
     # Display results
-    st.write(f"**Showing {len(filtered_df)} of {len(df)} entries**")
+    st.write(f"**Showing {total_count} of {total_entries} entries**")
 
-    if filtered_df.empty:
+    if total_count == 0:
         st.warning("No entries match your filters")
         return
 
@@ -503,21 +727,20 @@ def render_all_entries_page():
         options=["Date (Newest)", "Date (Oldest)", "Mood (Highest)", "Mood (Lowest)"]
     )
 
-    if sort_by == "Date (Newest)":
-        filtered_df = filtered_df.sort_values('timestamp', ascending=False)
-    elif sort_by == "Date (Oldest)":
-        filtered_df = filtered_df.sort_values('timestamp', ascending=True)
-    elif sort_by == "Mood (Highest)":
-        filtered_df = filtered_df.sort_values('ai_sentiment_score', ascending=False)
-    else:  # Mood (Lowest)
-        filtered_df = filtered_df.sort_values('ai_sentiment_score', ascending=True)
+    sort_map = {
+        "Date (Newest)": ('timestamp', True),
+        "Date (Oldest)": ('timestamp', False),
+        "Mood (Highest)": ('ai_sentiment_score', True),
+        "Mood (Lowest)": ('ai_sentiment_score', False)
+    }
+    sort_col, sort_desc = sort_map[sort_by]
 
     # Display entries
     st.markdown("---")
 
     # Pagination
     entries_per_page = 20
-    total_pages = (len(filtered_df) - 1) // entries_per_page + 1
+    total_pages = (total_count - 1) // entries_per_page + 1
 
     if 'current_page' not in st.session_state:
         st.session_state.current_page = 1
@@ -529,75 +752,109 @@ def render_all_entries_page():
         value=st.session_state.current_page
     )
 
-    start_idx = (page - 1) * entries_per_page
-    end_idx = start_idx + entries_per_page
+    page_df = _add_display_columns(dm.query_entries(
+        **filters,
+        sort_col=sort_col,
+        sort_desc=sort_desc,
+        limit=entries_per_page,
+        offset=(page - 1) * entries_per_page
+    ))
+
+    # One table for the whole page, details only for the selected entry.
+    # The selection is a row index kept under the widget key, so the key
+    # follows what the table shows and a new page, sort, filter or saved
+    # change starts without a selection instead of pointing at another entry
+    table_key = hash((version, page, sort_by, start_date, end_date, tuple(sentiment_filter), keyword))
+    event = st.dataframe(
+        page_df[['timestamp', 'mood_emoji', 'ai_sentiment_label', 'ai_sentiment_score', 'entry_text']],
+        key=f"entries_table_{table_key}",
+        on_select="rerun",
+        selection_mode="single-row",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'timestamp': st.column_config.DatetimeColumn("Date", format="YYYY-MM-DD HH:mm"),
+            'mood_emoji': st.column_config.TextColumn("Mood"),
+            'ai_sentiment_label': st.column_config.TextColumn("Sentiment"),
+            'ai_sentiment_score': st.column_config.NumberColumn("Score", format="%.2f"),
+            'entry_text': st.column_config.TextColumn("Entry", width="large")
+        }
+    )
 
-    page_df = filtered_df.iloc[start_idx:end_idx]
+    selected_rows = event.selection.rows
 
-    for idx, row in page_df.iterrows():
-        with st.container():
-            col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    if not selected_rows:
+        st.caption("Select an entry to view it in full")
+        return
 
-            with col1:
-                st.write(f"**{row['timestamp'].strftime('%Y-%m-%d %H:%M')}**")
+    row = page_df.iloc[selected_rows[0]]
 
-            with col2:
-                mood_color = get_mood_color(row['ai_sentiment_score'])
-                st.markdown(
-                    f"<span style='color:{mood_color}'>●</span> {row['ai_sentiment_label']}",
-                    unsafe_allow_html=True
-                )
+    st.markdown("---")
 
-            with col3:
-                st.write(f"Score: {row['ai_sentiment_score']:.2f}")
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
 
-            with col4:
-                if st.button("Delete", key=f"del_{row['id']}"):
-                    if dm.delete_entry(row['id']):
-                        st.success("Deleted!")
-                        st.rerun()
+    with col1:
+        st.write(f"**{row['timestamp'].strftime('%Y-%m-%d %H:%M')}**")
 
-            with st.expander("View Full Entry"):
-                st.write(row['entry_text'])
-                st.write(f"**Emotions:** {', '.join(row['detected_emotions'])}")
-                st.write(f"**Keywords:** {', '.join(row['keywords'])}")
+    with col2:
+        st.markdown(
+            f"<span style='color:{row['mood_color']}'>●</span> {row['ai_sentiment_label']}",
+            unsafe_allow_html=True
+        )
 
-            st.markdown("---")
+    with col3:
+        st.write(f"Score: {row['ai_sentiment_score']:.2f}")
+
+    with col4:
+        if st.button("Delete", key=f"del_{row['id']}"):
+            if dm.delete_entry(row['id']):
+                st.success("Deleted!")
+                st.rerun()
+
+    st.write(row['entry_text'])
+    st.write(f"**Emotions:** {row['emotions_str']}")
+    st.write(f"**Keywords:** {row['keywords_str']}")
 
 
 def render_export_page():
     """Render the export data page"""
+    version = _entries_version()
+
     st.markdown('<h1 class="main-header">📥 Export Data</h1>', unsafe_allow_html=True)
 
     st.write("Export all your journal entries to a CSV file for backup or analysis.")
 
-    df = dm.get_all_entries()
+    df = _load_entries(version)
 
     if df.empty:
         st.info("No data to export yet.")
         return
 
+    export_columns = [col for col in df.columns if col not in _DERIVED_COLUMNS]
+
     st.write(f"**Total Entries:** {len(df)}")
 
     # Preview
     st.markdown("### Preview")
-    st.dataframe(df.head(10))
+    st.dataframe(df.head(10)[export_columns])
 
     # Export button
     if st.button("Download CSV", type="primary"):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"journal_export_{timestamp}.csv"
 
-        # Prepare dataframe for export
-        export_df = df.copy()
-        export_df['detected_emotions'] = export_df['detected_emotions'].apply(str)
-        export_df['keywords'] = export_df['keywords'].apply(str)
+        # Convert lists to JSON strings for CSV export, leaving df untouched
+        export_df = df[export_columns].assign(
+            detected_emotions=df['detected_emotions'].map(json.dumps),
+            keywords=df['keywords'].map(json.dumps)
+        )
 
-        csv = export_df.to_csv(index=False)
+        buf = io.BytesIO()
+        export_df.to_csv(buf, index=False)
 
         st.download_button(
             label="Click to Download",
-            data=csv,
+            data=buf.getvalue(),
             file_name=filename,
             mime="text/csv"
         )
@@ -12,7 +12,7 @@ import random
 sys.path.insert(0, os.path.dirname(__file__))
 
 from utils.data_manager import DataManager
-from utils.sentiment_analyzer_lite import analyze_sentiment
+from utils.sentiment_analyzer_lite import analyze_sentiment_batch
 
 
 # Sample journal entries with varying sentiments
@@ -106,48 +106,38 @@ def create_sample_data(num_entries: int = None):
     # Select entries to create
     entries_to_create = SAMPLE_ENTRIES if num_entries is None else SAMPLE_ENTRIES[:num_entries]
 
+    # Analyze all entries in one batch, each distinct text only once
+    texts = [entry_data['text'] for entry_data in entries_to_create]
+    unique_texts = list(dict.fromkeys(texts))
+    results = dict(zip(unique_texts, analyze_sentiment_batch(unique_texts)))
+    analyses = [results[text] for text in texts]
+
+    # Build entries with custom timestamps for a single bulk insert
+    now = datetime.now()
+    entries = [
+        {
+            'timestamp': now - timedelta(days=entry_data['days_ago']),
+            'entry_text': entry_data['text'],
+            'ai_sentiment_label': analysis['label'],
+            'ai_sentiment_score': analysis['score'],
+            'ai_confidence': analysis['confidence'],
+            'detected_emotions': analysis['emotions'],
+            'keywords': analysis['keywords']
+        }
+        for entry_data, analysis in zip(entries_to_create, analyses)
+    ]
+
     created_count = 0
-    for entry_data in entries_to_create:
-        try:
-            # Calculate timestamp
-            timestamp = datetime.now() - timedelta(days=entry_data['days_ago'])
-
-            # Analyze sentiment
-            analysis = analyze_sentiment(entry_data['text'])
-
-            # Save entry
-            # Note: We're bypassing the normal save to set custom timestamps
-            import sqlite3
-            import json
-            conn = sqlite3.connect(dm.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT INTO journal_entries (
-                    timestamp, entry_text, ai_sentiment_label,
-                    ai_sentiment_score, ai_confidence, word_count,
-                    detected_emotions, keywords
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                timestamp,
-                entry_data['text'],
-                analysis['label'],
-                analysis['score'],
-                analysis['confidence'],
-                len(entry_data['text'].split()),
-                json.dumps(analysis['emotions']),
-                json.dumps(analysis['keywords'])
-            ))
-
-            conn.commit()
-            conn.close()
-
-            created_count += 1
-            print(f"✅ Created entry {created_count}/{len(entries_to_create)}: {analysis['label']} "
+    try:
+        created_count = dm.save_entries(entries)
+        for i, (entry_data, analysis) in enumerate(zip(entries_to_create, analyses), start=1):
+            print(f"✅ Created entry {i}/{len(entries_to_create)}: {analysis['label']} "
                   f"({entry_data['days_ago']} days ago)")
 
-        except Exception as e:
-            print(f"❌ Error creating entry: {e}")
+    except Exception as e:
+        print(f"❌ Error creating entries: {e}")
+    finally:
+        dm.close()
 
     print(f"\n🎉 Successfully created {created_count} sample entries!")
     print("You can now run the app with: streamlit run app.py")
@@ -3,21 +3,48 @@ Data Manager for Emotional Journal MVP
 Handles SQLite database operations for journal entries
 """
 
+import csv
 import sqlite3
+import numpy as np
 import pandas as pd
+from dateutil.tz import tzlocal
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Tuple
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, Optional, List, Dict, Tuple
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson is much faster for the JSON list fields, fall back to the stdlib
+# json module without it
+try:
+    import orjson
+
+    def _json_dumps(value) -> str:
+        return orjson.dumps(value).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 
 class DataManager:
     """Manages SQLite database operations for journal entries"""
 
+    # Insert statement shared by save_entry and save_entries
+    _INSERT_ENTRY_SQL = '''
+        INSERT INTO journal_entries (
+            timestamp, entry_text, user_selected_mood, ai_sentiment_label,
+            ai_sentiment_score, ai_confidence, word_count,
+            detected_emotions, keywords
+        ) VALUES (COALESCE(?, CAST(strftime('%s', 'now') AS INTEGER)), ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
     def __init__(self, db_path: str = "data/journal_entries.db"):
         """
         Initialize database connection and create tables if needed
@@ -32,41 +59,250 @@ class DataManager:
         if db_dir:  # Only create if there's a directory component
             os.makedirs(db_dir, exist_ok=True)
 
+        # Open one long-lived connection in autocommit mode, shared by all
+        # threads. Transactions are managed explicitly and every use of the
+        # connection, reads included, is serialized with a lock so a read
+        # never sees another thread's uncommitted writes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+
+        # Transactions committed through this DataManager, see get_data_version
+        self._commits = 0
+
+        # WAL lets readers run alongside a writer and makes commits cheap
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Keep temp tables and a 64 MB page cache in memory, and read the
+        # database file through a 256 MB memory map
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-64000")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+
         # Initialize database
         self._create_tables()
         logger.info(f"Database initialized at {db_path}")
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        return self._conn
+
+    def close(self):
+        """Close the shared database connection"""
+        with self._lock:
+            self._conn.close()
+        logger.info(f"Database connection to {self.db_path} closed")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run writes in a single transaction on the shared connection
+
+        Yields:
+            Cursor to execute statements with, committed on success and
+            rolled back if an exception is raised
+        """
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                yield cursor
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            self._commits += 1
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run reads on the shared connection
+
+        Yields:
+            Cursor to execute queries with, holding the connection lock so no
+            transaction is open and the connection is not closed meanwhile
+        """
+        with self._lock:
+            yield self._get_connection().cursor()
+
+    def get_data_version(self) -> Tuple[int, int]:
+        """
+        Cheap token that changes whenever the stored entries may have changed
+
+        SQLite's data_version only changes for commits made by other
+        connections (another process such as create_sample_data.py), so it is
+        paired with a count of the commits made through this DataManager
+
+        Returns:
+            Tuple of (commits through this DataManager, SQLite data_version)
+        """
+        with self._read() as cursor:
+            cursor.execute("PRAGMA data_version")
+            return self._commits, cursor.fetchone()[0]
 
     def _create_tables(self):
         """Create database tables if they don't exist"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS journal_entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                entry_text TEXT NOT NULL,
-                user_selected_mood TEXT,
-                ai_sentiment_label TEXT,
-                ai_sentiment_score REAL,
-                ai_confidence REAL,
-                word_count INTEGER,
-                detected_emotions TEXT,
-                keywords TEXT
+        with self.transaction() as cursor:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS journal_entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                    entry_text TEXT NOT NULL,
+                    user_selected_mood TEXT,
+                    ai_sentiment_label TEXT,
+                    ai_sentiment_score REAL,
+                    ai_confidence REAL,
+                    word_count INTEGER,
+                    detected_emotions TEXT,
+                    keywords TEXT
+                )
+            ''')
+
+            # Older databases stored timestamps as text, convert them to unix
+            # epoch seconds. The text is ambiguous: the column default
+            # CURRENT_TIMESTAMP wrote UTC without fractional seconds, while
+            # create_sample_data.py inserted naive local datetime.now() values,
+            # which sqlite3 stores with microseconds. Text with a fractional
+            # part is read as local time, the rest as UTC (a local value with
+            # exactly zero microseconds would be shifted by the UTC offset)
+            cursor.execute('''
+                UPDATE journal_entries
+                SET timestamp = CAST(
+                    CASE WHEN timestamp LIKE '%.%'
+                         THEN strftime('%s', timestamp, 'utc')
+                         ELSE strftime('%s', timestamp)
+                    END AS INTEGER)
+                WHERE typeof(timestamp) = 'text'
+            ''')
+
+            # Timestamp plus score covers the rolling average queries in
+            # get_stats and, scanned backwards, ORDER BY timestamp DESC
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_timestamp_score'"
             )
-        ''')
+            needs_analyze = cursor.fetchone() is None
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_timestamp_score
+                ON journal_entries(timestamp, ai_sentiment_score)
+            ''')
+
+            # Superseded by idx_timestamp_score, which has the same prefix
+            cursor.execute("DROP INDEX IF EXISTS idx_timestamp")
 
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_timestamp
-            ON journal_entries(timestamp)
-        ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sentiment_label
+                ON journal_entries(ai_sentiment_label)
+            ''')
 
-        conn.commit()
-        conn.close()
+            # One row per emotion of each entry for get_stats, kept in sync
+            # with detected_emotions by triggers
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entry_emotions'"
+            )
+            needs_backfill = cursor.fetchone() is None
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS entry_emotions (
+                    entry_id INTEGER NOT NULL,
+                    emotion TEXT NOT NULL
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_entry_emotions_entry_id
+                ON entry_emotions(entry_id)
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_entry_emotions_emotion
+                ON entry_emotions(emotion)
+            ''')
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS entry_emotions_insert
+                AFTER INSERT ON journal_entries BEGIN
+                    INSERT INTO entry_emotions (entry_id, emotion)
+                    SELECT NEW.id, value FROM json_each(NEW.detected_emotions);
+                END
+            ''')
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS entry_emotions_update
+                AFTER UPDATE OF detected_emotions ON journal_entries BEGIN
+                    DELETE FROM entry_emotions WHERE entry_id = OLD.id;
+                    INSERT INTO entry_emotions (entry_id, emotion)
+                    SELECT NEW.id, value FROM json_each(NEW.detected_emotions);
+                END
+            ''')
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS entry_emotions_delete
+                AFTER DELETE ON journal_entries BEGIN
+                    DELETE FROM entry_emotions WHERE entry_id = OLD.id;
+                END
+            ''')
+
+            if needs_backfill:
+                cursor.execute('''
+                    INSERT INTO entry_emotions (entry_id, emotion)
+                    SELECT journal_entries.id, item.value
+                    FROM journal_entries, json_each(journal_entries.detected_emotions) AS item
+                ''')
+
+            # Keyword side table from earlier versions, nothing reads it
+            for trigger in ('entry_keywords_insert', 'entry_keywords_update', 'entry_keywords_delete'):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            cursor.execute("DROP TABLE IF EXISTS entry_keywords")
+
+            # Full-text index over entry text for search_entries
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entries_fts'"
+            )
+            needs_rebuild = cursor.fetchone() is None
+
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+                    entry_text,
+                    content='journal_entries',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS entries_fts_insert
+                AFTER INSERT ON journal_entries BEGIN
+                    INSERT INTO entries_fts (rowid, entry_text)
+                    VALUES (NEW.id, NEW.entry_text);
+                END
+            ''')
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS entries_fts_update
+                AFTER UPDATE OF entry_text ON journal_entries BEGIN
+                    INSERT INTO entries_fts (entries_fts, rowid, entry_text)
+                    VALUES ('delete', OLD.id, OLD.entry_text);
+                    INSERT INTO entries_fts (rowid, entry_text)
+                    VALUES (NEW.id, NEW.entry_text);
+                END
+            ''')
+
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS entries_fts_delete
+                AFTER DELETE ON journal_entries BEGIN
+                    INSERT INTO entries_fts (entries_fts, rowid, entry_text)
+                    VALUES ('delete', OLD.id, OLD.entry_text);
+                END
+            ''')
+
+            if needs_rebuild:
+                cursor.execute("INSERT INTO entries_fts (entries_fts) VALUES ('rebuild')")
+
+            # Collect statistics so the planner knows about the new index
+            if needs_analyze:
+                cursor.execute("ANALYZE")
 
     def save_entry(
         self,
@@ -93,55 +329,144 @@ class DataManager:
         Returns:
             Entry ID of the newly created entry
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        word_count = len(entry_text.split())
-        emotions_json = json.dumps(detected_emotions) if detected_emotions else None
-        keywords_json = json.dumps(keywords) if keywords else None
-
-        cursor.execute('''
-            INSERT INTO journal_entries (
-                entry_text, user_selected_mood, ai_sentiment_label,
-                ai_sentiment_score, ai_confidence, word_count,
-                detected_emotions, keywords
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            entry_text, user_selected_mood, ai_sentiment_label,
-            ai_sentiment_score, ai_confidence, word_count,
-            emotions_json, keywords_json
-        ))
+        entry = {
+            'entry_text': entry_text,
+            'user_selected_mood': user_selected_mood,
+            'ai_sentiment_label': ai_sentiment_label,
+            'ai_sentiment_score': ai_sentiment_score,
+            'ai_confidence': ai_confidence,
+            'detected_emotions': detected_emotions,
+            'keywords': keywords
+        }
 
-        entry_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self.transaction() as cursor:
+            cursor.execute(self._INSERT_ENTRY_SQL, self._entry_values(entry))
+            entry_id = cursor.lastrowid
 
         logger.info(f"Entry {entry_id} saved successfully")
         return entry_id
 
-    def get_all_entries(self) -> pd.DataFrame:
+    def save_entries(self, entries: List[Dict]) -> int:
         """
-        Get all journal entries as a pandas DataFrame
+        Save several journal entries in a single transaction
+
+        Args:
+            entries: Entries as dictionaries with the save_entry arguments as
+                keys, plus an optional 'timestamp' (defaults to now)
 
         Returns:
-            DataFrame with all entries
+            Number of entries saved
         """
-        conn = self._get_connection()
-        df = pd.read_sql_query("SELECT * FROM journal_entries ORDER BY timestamp DESC", conn)
-        conn.close()
+        rows = [self._entry_values(entry) for entry in entries]
 
-        # Parse JSON fields
-        if not df.empty:
-            df['detected_emotions'] = df['detected_emotions'].apply(
-                lambda x: json.loads(x) if x else []
-            )
-            df['keywords'] = df['keywords'].apply(
-                lambda x: json.loads(x) if x else []
-            )
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format='mixed')
+        with self.transaction() as cursor:
+            cursor.executemany(self._INSERT_ENTRY_SQL, rows)
+
+        logger.info(f"{len(rows)} entries saved successfully")
+        return len(rows)
+
+    def _entry_values(self, entry: Dict) -> Tuple:
+        """
+        Build the INSERT parameters for one entry
+
+        Args:
+            entry: Entry as a dictionary with the save_entry arguments as keys
+
+        Returns:
+            Tuple of values for _INSERT_ENTRY_SQL
+        """
+        entry_text = entry['entry_text']
+        detected_emotions = entry.get('detected_emotions')
+        keywords = entry.get('keywords')
+
+        timestamp = entry.get('timestamp')
+
+        return (
+            self._to_epoch(timestamp) if timestamp is not None else None,
+            entry_text,
+            entry.get('user_selected_mood'),
+            entry.get('ai_sentiment_label'),
+            entry.get('ai_sentiment_score'),
+            entry.get('ai_confidence'),
+            len(entry_text.split()),
+            _json_dumps(detected_emotions) if detected_emotions else None,
+            _json_dumps(keywords) if keywords else None
+        )
+
+    def _to_epoch(self, value) -> int:
+        """
+        Convert a local date or datetime to unix epoch seconds
+
+        Args:
+            value: datetime, date (its local midnight) or epoch seconds
+
+        Returns:
+            Unix epoch seconds as stored in the timestamp column
+        """
+        if isinstance(value, datetime):
+            return int(value.timestamp())
+        if isinstance(value, date):
+            return int(datetime.combine(value, time.min).timestamp())
+        return int(value)
+
+    def _read_entries(self, query: str, params: Tuple = ()) -> pd.DataFrame:
+        """
+        Run a journal_entries query and load the rows as parsed entries
+
+        Args:
+            query: SELECT statement returning journal_entries columns
+            params: Query parameters
+
+        Returns:
+            DataFrame with the matching entries
+        """
+        with self._read() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            columns = [column[0] for column in cursor.description]
+
+        df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+        return self._hydrate(df)
+
+    def _hydrate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse JSON list fields and timestamps of entries read from the database
+
+        Args:
+            df: DataFrame with raw journal_entries rows
+
+        Returns:
+            The same DataFrame with parsed fields
+        """
+        if df.empty:
+            return df
+
+        # Entries repeat a handful of emotion/keyword lists, so decode each
+        # distinct string once (rows with equal strings share the list)
+        for column in ('detected_emotions', 'keywords'):
+            codes, uniques = pd.factorize(df[column].fillna('[]'))
+            decoded = [_json_loads(value) for value in uniques]
+            df[column] = [decoded[code] for code in codes]
+
+        # Epoch seconds to naive local time, comparable with datetime.now()
+        df['timestamp'] = (
+            pd.to_datetime(df['timestamp'], unit='s', utc=True, cache=True)
+            .dt.tz_convert(tzlocal())
+            .dt.tz_localize(None)
+        )
 
         return df
 
+    def get_all_entries(self) -> pd.DataFrame:
+        """
+        Get all journal entries as a pandas DataFrame
+
+        Returns:
+            DataFrame with all entries
+        """
+        return self._read_entries("SELECT * FROM journal_entries ORDER BY timestamp DESC")
+
     def get_recent_entries(self, limit: int = 10) -> pd.DataFrame:
         """
         Get N most recent entries
@@ -152,22 +477,8 @@ class DataManager:
         Returns:
             DataFrame with recent entries
         """
-        conn = self._get_connection()
-        query = f"SELECT * FROM journal_entries ORDER BY timestamp DESC LIMIT {limit}"
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-
-        # Parse JSON fields
-        if not df.empty:
-            df['detected_emotions'] = df['detected_emotions'].apply(
-                lambda x: json.loads(x) if x else []
-            )
-            df['keywords'] = df['keywords'].apply(
-                lambda x: json.loads(x) if x else []
-            )
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format='mixed')
-
-        return df
+        query = "SELECT * FROM journal_entries ORDER BY timestamp DESC LIMIT ?"
+        return self._read_entries(query, (limit,))
 
     def get_entries_by_date_range(
         self,
@@ -184,57 +495,170 @@ class DataManager:
         Returns:
             DataFrame with filtered entries
         """
-        conn = self._get_connection()
         query = """
             SELECT * FROM journal_entries
             WHERE timestamp BETWEEN ? AND ?
             ORDER BY timestamp DESC
         """
-        df = pd.read_sql_query(query, conn, params=(start_date, end_date))
-        conn.close()
-
-        # Parse JSON fields
-        if not df.empty:
-            df['detected_emotions'] = df['detected_emotions'].apply(
-                lambda x: json.loads(x) if x else []
-            )
-            df['keywords'] = df['keywords'].apply(
-                lambda x: json.loads(x) if x else []
-            )
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format='mixed')
-
-        return df
+        return self._read_entries(query, (self._to_epoch(start_date), self._to_epoch(end_date)))
 
     def search_entries(self, keyword: str) -> pd.DataFrame:
         """
-        Search entries by keyword (case-insensitive)
+        Search entries for a word or phrase (case-insensitive)
+
+        Uses the full-text index, so matching is by whole words: the words
+        must appear in order, and the last one may be a prefix ('happ'
+        matches "happy", "so happ" matches "so happy"). Text inside a word
+        ('app' in "happy") does not match. A blank keyword returns all entries.
 
         Args:
-            keyword: Keyword to search for
+            keyword: Word or phrase to search for
 
         Returns:
             DataFrame with matching entries
         """
-        conn = self._get_connection()
+        if not keyword or not keyword.strip():
+            return self.get_all_entries()
+
         query = """
+            SELECT journal_entries.* FROM entries_fts
+            JOIN journal_entries ON journal_entries.id = entries_fts.rowid
+            WHERE entries_fts MATCH ?
+            ORDER BY journal_entries.timestamp DESC
+        """
+        # Quote the keyword so it is matched as a phrase, not FTS query syntax,
+        # and mark its last word as a prefix
+        phrase = '"' + keyword.strip().replace('"', '""') + '" *'
+        return self._read_entries(query, (phrase,))
+
+    def _build_filters(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sentiments: Optional[List[str]] = None,
+        keyword: Optional[str] = None
+    ) -> Tuple[str, List]:
+        """
+        Build a WHERE clause and its parameters for entry filters
+
+        Args:
+            start_date: First day to include
+            end_date: Last day to include
+            sentiments: Sentiment labels to include (empty/None for all)
+            keyword: Text to search for in entry text (case-insensitive)
+
+        Returns:
+            Tuple of (where_clause, params)
+        """
+        clauses = []
+        params = []
+
+        if start_date:
+            clauses.append("timestamp >= ?")
+            params.append(self._to_epoch(start_date))
+
+        if end_date:
+            clauses.append("timestamp < ?")
+            params.append(self._to_epoch(end_date + timedelta(days=1)))
+
+        if sentiments:
+            placeholders = ", ".join("?" for _ in sentiments)
+            clauses.append(f"ai_sentiment_label IN ({placeholders})")
+            params.extend(sentiments)
+
+        if keyword:
+            # Match the keyword literally, LIKE is already case-insensitive
+            escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            clauses.append("entry_text LIKE ? ESCAPE '\\'")
+            params.append(f'%{escaped}%')
+
+        where_clause = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where_clause, params
+
+    def query_entries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sentiments: Optional[List[str]] = None,
+        keyword: Optional[str] = None,
+        sort_col: str = "timestamp",
+        sort_desc: bool = True,
+        limit: int = 20,
+        offset: int = 0
+    ) -> pd.DataFrame:
+        """
+        Get one page of entries matching the given filters
+
+        Args:
+            start_date: First day to include
+            end_date: Last day to include
+            sentiments: Sentiment labels to include (empty/None for all)
+            keyword: Text to search for in entry text (case-insensitive)
+            sort_col: Column to sort by (timestamp or ai_sentiment_score)
+            sort_desc: Sort in descending order
+            limit: Maximum number of entries to return
+            offset: Number of matching entries to skip
+
+        Returns:
+            DataFrame with the requested page of entries
+        """
+        if sort_col not in ("timestamp", "ai_sentiment_score"):
+            raise ValueError(f"Cannot sort entries by {sort_col}")
+
+        where_clause, params = self._build_filters(start_date, end_date, sentiments, keyword)
+        direction = "DESC" if sort_desc else "ASC"
+
+        query = f"""
             SELECT * FROM journal_entries
-            WHERE LOWER(entry_text) LIKE LOWER(?)
-            ORDER BY timestamp DESC
+            {where_clause}
+            ORDER BY {sort_col} {direction}
+            LIMIT ? OFFSET ?
         """
-        df = pd.read_sql_query(query, conn, params=(f'%{keyword}%',))
-        conn.close()
+        return self._read_entries(query, (*params, limit, offset))
 
-        # Parse JSON fields
-        if not df.empty:
-            df['detected_emotions'] = df['detected_emotions'].apply(
-                lambda x: json.loads(x) if x else []
-            )
-            df['keywords'] = df['keywords'].apply(
-                lambda x: json.loads(x) if x else []
-            )
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format='mixed')
+    def count_entries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sentiments: Optional[List[str]] = None,
+        keyword: Optional[str] = None
+    ) -> int:
+        """
+        Count entries matching the given filters
 
-        return df
+        Args:
+            start_date: First day to include
+            end_date: Last day to include
+            sentiments: Sentiment labels to include (empty/None for all)
+            keyword: Text to search for in entry text (case-insensitive)
+
+        Returns:
+            Number of matching entries
+        """
+        where_clause, params = self._build_filters(start_date, end_date, sentiments, keyword)
+
+        with self._read() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM journal_entries {where_clause}", params)
+            return cursor.fetchone()[0]
+
+    def get_date_range(self) -> Optional[Tuple[date, date]]:
+        """
+        Get the dates of the oldest and newest entries
+
+        Returns:
+            Tuple of (first_date, last_date) or None if there are no entries
+        """
+        with self._read() as cursor:
+            cursor.execute("SELECT MIN(timestamp), MAX(timestamp) FROM journal_entries")
+            first_timestamp, last_timestamp = cursor.fetchone()
+
+        if first_timestamp is None:
+            return None
+
+        return (
+            datetime.fromtimestamp(first_timestamp).date(),
+            datetime.fromtimestamp(last_timestamp).date()
+        )
 
     def delete_entry(self, entry_id: int) -> bool:
         """
@@ -247,11 +671,8 @@ class DataManager:
             True if successful, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM journal_entries WHERE id = ?", (entry_id,))
-            conn.commit()
-            conn.close()
+            with self.transaction() as cursor:
+                cursor.execute("DELETE FROM journal_entries WHERE id = ?", (entry_id,))
             logger.info(f"Entry {entry_id} deleted successfully")
             return True
         except Exception as e:
@@ -268,13 +689,27 @@ class DataManager:
         Returns:
             Path to exported file
         """
-        df = self.get_all_entries()
+        with self._read() as cursor:
+            cursor.execute("""
+                SELECT
+                    id, datetime(timestamp, 'unixepoch', 'localtime') AS timestamp,
+                    entry_text, user_selected_mood, ai_sentiment_label,
+                    ai_sentiment_score, ai_confidence, word_count,
+                    detected_emotions, keywords
+                FROM journal_entries
+                ORDER BY journal_entries.timestamp DESC
+            """)
+
+            # Stream rows straight from the cursor, list fields stay as stored JSON
+            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(column[0] for column in cursor.description)
+                while True:
+                    rows = cursor.fetchmany(10000)
+                    if not rows:
+                        break
+                    writer.writerows(rows)
 
-        # Convert lists to strings for CSV export
-        df['detected_emotions'] = df['detected_emotions'].apply(str)
-        df['keywords'] = df['keywords'].apply(str)
-
-        df.to_csv(filepath, index=False)
         logger.info(f"Data exported to {filepath}")
         return filepath
 
@@ -285,43 +720,67 @@ class DataManager:
         Returns:
             Dictionary with statistics
         """
-        df = self.get_all_entries()
-
-        if df.empty:
-            return {
-                'total_entries': 0,
-                'current_streak': 0,
-                'longest_streak': 0,
-                'avg_mood_7d': 0,
-                'avg_mood_30d': 0,
-                'most_common_emotion': None,
-                'consistency_30d': 0
-            }
-
-        # Total entries
-        total_entries = len(df)
-
-        # Current and longest streak
-        current_streak, longest_streak = self._calculate_streaks(df)
-
-        # Average mood (last 7 and 30 days)
         now = datetime.now()
-        df_7d = df[df['timestamp'] >= now - timedelta(days=7)]
-        df_30d = df[df['timestamp'] >= now - timedelta(days=30)]
-
-        avg_mood_7d = df_7d['ai_sentiment_score'].mean() if not df_7d.empty else 0
-        avg_mood_30d = df_30d['ai_sentiment_score'].mean() if not df_30d.empty else 0
+        cutoff_7d = self._to_epoch(now - timedelta(days=7))
+        cutoff_30d = self._to_epoch(now - timedelta(days=30))
+
+        with self._read() as cursor:
+            # Total entries
+            cursor.execute("SELECT COUNT(*) FROM journal_entries")
+            total_entries = cursor.fetchone()[0]
+
+            if total_entries == 0:
+                return {
+                    'total_entries': 0,
+                    'current_streak': 0,
+                    'longest_streak': 0,
+                    'avg_mood_7d': 0,
+                    'avg_mood_30d': 0,
+                    'most_common_emotion': None,
+                    'consistency_30d': 0
+                }
+
+            # Days with entries, for the streaks
+            cursor.execute(
+                "SELECT DISTINCT date(timestamp, 'unixepoch', 'localtime') "
+                "FROM journal_entries ORDER BY 1 DESC"
+            )
+            day_rows = cursor.fetchall()
 
-        # Most common emotion
-        all_emotions = []
-        for emotions in df['detected_emotions']:
-            if emotions:
-                all_emotions.extend(emotions)
+            # Average mood (last 7 and 30 days)
+            cursor.execute(
+                "SELECT AVG(ai_sentiment_score) FROM journal_entries WHERE timestamp >= ?",
+                (cutoff_7d,)
+            )
+            avg_mood_7d = cursor.fetchone()[0] or 0
+
+            cursor.execute(
+                """
+                SELECT AVG(ai_sentiment_score),
+                       COUNT(DISTINCT date(timestamp, 'unixepoch', 'localtime'))
+                FROM journal_entries
+                WHERE timestamp >= ?
+                """,
+                (cutoff_30d,)
+            )
+            avg_mood_30d, unique_days = cursor.fetchone()
+            avg_mood_30d = avg_mood_30d or 0
+
+            # Most common emotion
+            cursor.execute("""
+                SELECT emotion FROM entry_emotions
+                GROUP BY emotion
+                ORDER BY COUNT(*) DESC
+                LIMIT 1
+            """)
+            row = cursor.fetchone()
+            most_common_emotion = row[0] if row else None
 
-        most_common_emotion = max(set(all_emotions), key=all_emotions.count) if all_emotions else None
+        # Current and longest streak
+        dates = np.array([row[0] for row in day_rows], dtype='datetime64[D]')
+        current_streak, longest_streak = self._calculate_streaks(dates)
 
         # Consistency (% of days with entry in last 30 days)
-        unique_days = df_30d['timestamp'].dt.date.nunique()
         consistency_30d = (unique_days / 30) * 100
 
         return {
@@ -334,49 +793,36 @@ class DataManager:
             'consistency_30d': consistency_30d
         }
 
-    def _calculate_streaks(self, df: pd.DataFrame) -> Tuple[int, int]:
+    def _calculate_streaks(self, dates: np.ndarray) -> Tuple[int, int]:
         """
         Calculate current and longest journaling streaks
 
         Args:
-            df: DataFrame with entries
+            dates: Unique datetime64[D] dates with entries, newest first
 
         Returns:
             Tuple of (current_streak, longest_streak)
         """
-        if df.empty:
+        if len(dates) == 0:
             return 0, 0
 
-        # Get unique dates with entries
-        dates = sorted(df['timestamp'].dt.date.unique(), reverse=True)
-
-        if not dates:
-            return 0, 0
+        # Consecutive days are one day apart going back in time, every other
+        # gap ends a streak
+        gaps = np.diff(dates).astype(np.int64)
+        breaks = np.flatnonzero(gaps != -1)
 
         # Calculate current streak
-        current_streak = 1
-        today = datetime.now().date()
-        yesterday = today - timedelta(days=1)
+        today = np.datetime64(datetime.now().date(), 'D')
+        yesterday = today - np.timedelta64(1, 'D')
 
         if dates[0] == today or dates[0] == yesterday:
-            for i in range(len(dates) - 1):
-                if (dates[i] - dates[i + 1]).days == 1:
-                    current_streak += 1
-                else:
-                    break
+            current_streak = int(breaks[0]) + 1 if breaks.size else len(dates)
         else:
             current_streak = 0
 
         # Calculate longest streak
-        longest_streak = 1
-        temp_streak = 1
-
-        for i in range(len(dates) - 1):
-            if (dates[i] - dates[i + 1]).days == 1:
-                temp_streak += 1
-                longest_streak = max(longest_streak, temp_streak)
-            else:
-                temp_streak = 1
+        run_ends = np.concatenate(([-1], breaks, [len(dates) - 1]))
+        longest_streak = int(np.diff(run_ends).max())
 
         return current_streak, longest_streak
 
@@ -390,11 +836,9 @@ class DataManager:
         Returns:
             Entry as dictionary or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM journal_entries WHERE id = ?", (entry_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._read() as cursor:
+            cursor.execute("SELECT * FROM journal_entries WHERE id = ?", (entry_id,))
+            row = cursor.fetchone()
 
         if not row:
             return None
@@ -406,7 +850,8 @@ class DataManager:
         ]
 
         entry = dict(zip(columns, row))
-        entry['detected_emotions'] = json.loads(entry['detected_emotions']) if entry['detected_emotions'] else []
-        entry['keywords'] = json.loads(entry['keywords']) if entry['keywords'] else []
+        entry['timestamp'] = datetime.fromtimestamp(entry['timestamp'])
+        entry['detected_emotions'] = _json_loads(entry['detected_emotions']) if entry['detected_emotions'] else []
+        entry['keywords'] = _json_loads(entry['keywords']) if entry['keywords'] else []
 
         return entry
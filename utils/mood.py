@@ -0,0 +1,124 @@
+"""
+Mood display and keyword helpers for Emotional Journal MVP
+Shared by the transformer and lightweight sentiment analyzers
+"""
+
+import numpy as np
+from typing import List
+import re
+from collections import Counter
+
+# Words of three or more letters, compiled once for keyword extraction
+_TOKEN_RE = re.compile(r'\b[a-z]{3,}\b')
+
+# Common stop words to exclude from keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'i', 'you', 'he', 'she',
+    'it', 'we', 'they', 'my', 'your', 'his', 'her', 'its', 'our', 'their',
+    'this', 'that', 'these', 'those', 'am', 'me', 'just', 'so', 'very',
+    'really', 'too', 'much', 'more', 'most', 'some', 'any', 'all', 'both',
+    'each', 'few', 'many', 'other', 'such', 'no', 'not', 'only', 'own',
+    'same', 'than', 'then', 'there', 'when', 'where', 'why', 'how'
+})
+
+
+def extract_keywords(text: str, top_n: int = 5) -> List[str]:
+    """
+    Extract top keywords from text
+
+    Args:
+        text: Text to analyze
+        top_n: Number of keywords to extract
+
+    Returns:
+        List of keywords
+    """
+    # Count words that aren't stop words
+    word_counts = Counter(w for w in _TOKEN_RE.findall(text.lower()) if w not in _STOP_WORDS)
+
+    # Return top N keywords
+    return [word for word, _ in word_counts.most_common(top_n)]
+
+
+def get_mood_emoji(sentiment_score: float) -> str:
+    """
+    Get emoji representation of mood based on sentiment score
+
+    Args:
+        sentiment_score: Sentiment score (-1 to 1)
+
+    Returns:
+        Emoji string
+    """
+    if sentiment_score > 0.5:
+        return "😄"
+    elif sentiment_score > 0.3:
+        return "😊"
+    elif sentiment_score > -0.3:
+        return "😐"
+    elif sentiment_score > -0.5:
+        return "😢"
+    else:
+        return "😭"
+
+
+def get_mood_color(sentiment_score: float) -> str:
+    """
+    Get color code for mood based on sentiment score
+
+    Args:
+        sentiment_score: Sentiment score (-1 to 1)
+
+    Returns:
+        Hex color code
+    """
+    if sentiment_score > 0.3:
+        return "#4CAF50"  # Green
+    elif sentiment_score < -0.3:
+        return "#F44336"  # Red
+    else:
+        return "#FFC107"  # Yellow
+
+
+# Upper bounds of each get_mood_emoji bucket and the emoji for each bucket
+_MOOD_EMOJI_BOUNDS = np.array([-0.5, -0.3, 0.3, 0.5])
+_MOOD_EMOJIS = np.array(["😭", "😢", "😐", "😊", "😄"])
+
+# get_mood_color colors for red, yellow and green moods
+_MOOD_COLORS = np.array(["#F44336", "#FFC107", "#4CAF50"])
+
+
+def get_mood_emojis(sentiment_scores: np.ndarray) -> np.ndarray:
+    """
+    Get emoji representation of mood for many sentiment scores at once
+
+    Args:
+        sentiment_scores: Sentiment scores (-1 to 1)
+
+    Returns:
+        Array of emoji strings, same as get_mood_emoji for each score
+    """
+    scores = np.asarray(sentiment_scores, dtype=float)
+    buckets = np.searchsorted(_MOOD_EMOJI_BOUNDS, scores, side='left')
+    # NaN fails every comparison in get_mood_emoji
+    buckets[np.isnan(scores)] = 0
+    return _MOOD_EMOJIS[buckets]
+
+
+def get_mood_colors(sentiment_scores: np.ndarray) -> np.ndarray:
+    """
+    Get color codes for many sentiment scores at once
+
+    Args:
+        sentiment_scores: Sentiment scores (-1 to 1)
+
+    Returns:
+        Array of hex color codes, same as get_mood_color for each score
+    """
+    scores = np.asarray(sentiment_scores, dtype=float)
+    # 0 below -0.3, 2 above 0.3, 1 in between (and for NaN)
+    buckets = (~(scores < -0.3)).astype(int) + (scores > 0.3)
+    return _MOOD_COLORS[buckets]
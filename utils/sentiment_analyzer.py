@@ -5,58 +5,117 @@ Uses Hugging Face Transformers with TextBlob fallback
 
 import logging
 from typing import Dict, List
-import re
-from collections import Counter
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# get_mood_emoji and get_mood_color are re-exported for existing callers
+from utils.mood import extract_keywords, get_mood_color, get_mood_emoji  # noqa: F401
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global model cache
-_sentiment_pipeline = None
-_emotion_pipeline = None
+# Keywords that signal each emotion, matched as substrings of the lowercased text
+_EMOTION_KEYWORDS = {
+    'joy': ['happy', 'joy', 'excited', 'wonderful', 'amazing', 'great', 'love', 'fantastic'],
+    'sadness': ['sad', 'depressed', 'unhappy', 'down', 'crying', 'tears', 'lonely', 'miss'],
+    'anger': ['angry', 'mad', 'furious', 'annoyed', 'frustrated', 'irritated', 'hate'],
+    'fear': ['afraid', 'scared', 'anxious', 'worried', 'nervous', 'panic', 'terrified'],
+    'surprise': ['surprised', 'shocked', 'amazed', 'unexpected', 'sudden', 'wow'],
+    'gratitude': ['grateful', 'thankful', 'appreciate', 'blessed', 'lucky', 'fortunate'],
+    'hope': ['hope', 'optimistic', 'looking forward', 'excited about', 'can\'t wait'],
+    'stress': ['stressed', 'overwhelmed', 'pressure', 'burden', 'exhausted', 'tired']
+}
+
+# Models load once, locks stop concurrent callers from loading the same
+# model twice
+_sentiment_lock = threading.Lock()
+_emotion_lock = threading.Lock()
+
+# Batches of at least this many texts run the emotion model on a worker
+# thread alongside the sentiment model. Smaller ones run both models in
+# turn, running them at once only oversubscribes the CPU (each model uses
+# every core) without saving time
+_CONCURRENT_MIN_TEXTS = 64
+_emotion_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="emotion-model")
+
+
+def _pipeline_device_kwargs() -> Dict:
+    """Device and dtype arguments for pipelines, half precision on GPU only"""
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return {'device': 0, 'torch_dtype': torch.float16}
+    except ImportError:
+        pass
+    return {'device': -1}  # Use CPU
 
 
-def _load_sentiment_model():
-    """Load sentiment analysis model (singleton pattern)"""
-    global _sentiment_pipeline
+def _quantize_for_cpu(classifier):
+    """Swap a CPU pipeline's Linear layers for dynamic int8 ones"""
+    if classifier.device.type != 'cpu':
+        return classifier
 
-    if _sentiment_pipeline is None:
-        try:
-            from transformers import pipeline
-            logger.info("Loading Hugging Face sentiment model...")
-            _sentiment_pipeline = pipeline(
-                "sentiment-analysis",
-                model="distilbert-base-uncased-finetuned-sst-2-english",
-                device=-1  # Use CPU (set to 0 for GPU)
-            )
-            logger.info("Sentiment model loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load Hugging Face model: {e}")
-            _sentiment_pipeline = "failed"
+    try:
+        import torch
+        classifier.model = torch.quantization.quantize_dynamic(
+            classifier.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except Exception as e:
+        logger.warning(f"Keeping full precision model, int8 quantization failed: {e}")
 
-    return _sentiment_pipeline
+    return classifier
 
 
-def _load_emotion_model():
-    """Load emotion classification model (optional)"""
-    global _emotion_pipeline
+@lru_cache(maxsize=1)
+def _create_sentiment_pipeline():
+    """Create sentiment analysis pipeline, None if it can't be loaded"""
+    try:
+        from transformers import pipeline
+        logger.info("Loading Hugging Face sentiment model...")
+        sentiment_pipeline = pipeline(
+            "sentiment-analysis",
+            model="distilbert-base-uncased-finetuned-sst-2-english",
+            **_pipeline_device_kwargs()
+        )
+        sentiment_pipeline = _quantize_for_cpu(sentiment_pipeline)
+        logger.info("Sentiment model loaded successfully")
+        return sentiment_pipeline
+    except Exception as e:
+        logger.error(f"Failed to load Hugging Face model: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _create_emotion_pipeline():
+    """Create emotion classification pipeline, None if it can't be loaded"""
+    try:
+        from transformers import pipeline
+        logger.info("Loading emotion classification model...")
+        emotion_pipeline = pipeline(
+            "text-classification",
+            model="j-hartmann/emotion-english-distilroberta-base",
+            top_k=None,
+            **_pipeline_device_kwargs()
+        )
+        emotion_pipeline = _quantize_for_cpu(emotion_pipeline)
+        logger.info("Emotion model loaded successfully")
+        return emotion_pipeline
+    except Exception as e:
+        logger.warning(f"Emotion model not available: {e}")
+        return None
+
+
+def _load_sentiment_model():
+    """Load sentiment analysis model (singleton pattern)"""
+    with _sentiment_lock:
+        return _create_sentiment_pipeline()
 
-    if _emotion_pipeline is None:
-        try:
-            from transformers import pipeline
-            logger.info("Loading emotion classification model...")
-            _emotion_pipeline = pipeline(
-                "text-classification",
-                model="j-hartmann/emotion-english-distilroberta-base",
-                device=-1,
-                top_k=None
-            )
-            logger.info("Emotion model loaded successfully")
-        except Exception as e:
-            logger.warning(f"Emotion model not available: {e}")
-            _emotion_pipeline = "failed"
 
-    return _emotion_pipeline
+def _load_emotion_model():
+    """Load emotion classification model (optional)"""
+    with _emotion_lock:
+        return _create_emotion_pipeline()
 
 
 def _fallback_sentiment_textblob(text: str) -> Dict:
@@ -95,41 +154,6 @@ def _fallback_sentiment_textblob(text: str) -> Dict:
         }
 
 
-def _extract_keywords(text: str, top_n: int = 5) -> List[str]:
-    """
-    Extract top keywords from text
-
-    Args:
-        text: Text to analyze
-        top_n: Number of keywords to extract
-
-    Returns:
-        List of keywords
-    """
-    # Common stop words to exclude
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-        'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'can', 'i', 'you', 'he', 'she',
-        'it', 'we', 'they', 'my', 'your', 'his', 'her', 'its', 'our', 'their',
-        'this', 'that', 'these', 'those', 'am', 'me', 'just', 'so', 'very',
-        'really', 'too', 'much', 'more', 'most', 'some', 'any', 'all', 'both',
-        'each', 'few', 'many', 'other', 'such', 'no', 'not', 'only', 'own',
-        'same', 'than', 'then', 'there', 'when', 'where', 'why', 'how'
-    }
-
-    # Clean and tokenize text
-    words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-
-    # Filter stop words and count
-    filtered_words = [w for w in words if w not in stop_words]
-    word_counts = Counter(filtered_words)
-
-    # Return top N keywords
-    return [word for word, _ in word_counts.most_common(top_n)]
-
-
 def _detect_emotions_from_keywords(text: str, sentiment_label: str) -> List[str]:
     """
     Detect emotions based on keywords (simple rule-based approach)
@@ -143,19 +167,8 @@ def _detect_emotions_from_keywords(text: str, sentiment_label: str) -> List[str]
     """
     text_lower = text.lower()
 
-    emotion_keywords = {
-        'joy': ['happy', 'joy', 'excited', 'wonderful', 'amazing', 'great', 'love', 'fantastic'],
-        'sadness': ['sad', 'depressed', 'unhappy', 'down', 'crying', 'tears', 'lonely', 'miss'],
-        'anger': ['angry', 'mad', 'furious', 'annoyed', 'frustrated', 'irritated', 'hate'],
-        'fear': ['afraid', 'scared', 'anxious', 'worried', 'nervous', 'panic', 'terrified'],
-        'surprise': ['surprised', 'shocked', 'amazed', 'unexpected', 'sudden', 'wow'],
-        'gratitude': ['grateful', 'thankful', 'appreciate', 'blessed', 'lucky', 'fortunate'],
-        'hope': ['hope', 'optimistic', 'looking forward', 'excited about', 'can\'t wait'],
-        'stress': ['stressed', 'overwhelmed', 'pressure', 'burden', 'exhausted', 'tired']
-    }
-
     detected = []
-    for emotion, keywords in emotion_keywords.items():
+    for emotion, keywords in _EMOTION_KEYWORDS.items():
         if any(keyword in text_lower for keyword in keywords):
             detected.append(emotion)
 
@@ -171,37 +184,66 @@ def _detect_emotions_from_keywords(text: str, sentiment_label: str) -> List[str]
     return detected[:3]  # Return top 3 emotions
 
 
-def _detect_emotions_with_model(text: str) -> List[str]:
+def _detect_emotions_with_model(texts: List[str], batch_size: int = 32) -> List[List[str]]:
     """
     Detect emotions using transformer model
 
     Args:
-        text: Text to analyze
+        texts: Texts to analyze
+        batch_size: Number of texts per model forward pass
 
     Returns:
-        List of detected emotions
+        List of detected emotions for each text (empty if the model is unavailable)
     """
     emotion_pipeline = _load_emotion_model()
 
-    if emotion_pipeline == "failed" or emotion_pipeline is None:
-        return []
+    if emotion_pipeline is None:
+        return [[] for _ in texts]
 
     try:
-        # Truncate text to avoid token limit issues
-        truncated_text = text[:512]
+        results = emotion_pipeline(texts, batch_size=batch_size, truncation=True, max_length=512)
 
-        results = emotion_pipeline(truncated_text)
-
-        if results and isinstance(results, list) and len(results) > 0:
-            # Sort by score and get top 3
-            sorted_emotions = sorted(results[0], key=lambda x: x['score'], reverse=True)
-            return [e['label'] for e in sorted_emotions[:3]]
-        else:
-            return []
+        # Sort each text's scores and get top 3
+        return [
+            [e['label'] for e in sorted(scores, key=lambda x: x['score'], reverse=True)[:3]]
+            for scores in results
+        ]
 
     except Exception as e:
         logger.warning(f"Emotion detection failed: {e}")
-        return []
+        return [[] for _ in texts]
+
+
+def _to_sentiment_data(result: Dict) -> Dict:
+    """
+    Convert a sentiment pipeline result to the -1 to 1 scale
+
+    Args:
+        result: Pipeline output with label and score
+
+    Returns:
+        Dictionary with sentiment data
+    """
+    if result['label'] == 'POSITIVE':
+        score = result['score']
+    else:  # NEGATIVE
+        score = -result['score']
+
+    # Determine label with neutral zone
+    if score > 0.3:
+        label = 'POSITIVE'
+    elif score < -0.3:
+        label = 'NEGATIVE'
+    else:
+        label = 'NEUTRAL'
+
+    logger.info(f"Sentiment analysis: {label} (score: {score:.2f})")
+
+    return {
+        'label': label,
+        'score': score,
+        'confidence': result['score']
+    }
 
 
 def analyze_sentiment(text: str) -> Dict:
@@ -221,103 +263,75 @@ def analyze_sentiment(text: str) -> Dict:
             'keywords': list        # Top keywords
         }
     """
-    # Load model
-    sentiment_pipeline = _load_sentiment_model()
+    return analyze_sentiment_batch([text])[0]
 
-    # Try Hugging Face model first
-    if sentiment_pipeline != "failed" and sentiment_pipeline is not None:
-        try:
-            # Truncate text to model's max length
-            truncated_text = text[:512]
-
-            result = sentiment_pipeline(truncated_text)[0]
 
-            # Convert to -1 to 1 scale
-            if result['label'] == 'POSITIVE':
-                score = result['score']
-            else:  # NEGATIVE
-                score = -result['score']
+def _detect_sentiments(texts: List[str], batch_size: int) -> List[Dict]:
+    """
+    Sentiment of each text, from the Hugging Face model or the TextBlob fallback
 
-            # Determine label with neutral zone
-            if score > 0.3:
-                label = 'POSITIVE'
-            elif score < -0.3:
-                label = 'NEGATIVE'
-            else:
-                label = 'NEUTRAL'
+    Args:
+        texts: Texts to analyze
+        batch_size: Number of texts per model forward pass
 
-            sentiment_data = {
-                'label': label,
-                'score': score,
-                'confidence': result['score']
-            }
+    Returns:
+        List of sentiment data for each text
+    """
+    # Load model
+    sentiment_pipeline = _load_sentiment_model()
 
-            logger.info(f"Sentiment analysis: {label} (score: {score:.2f})")
+    # Try Hugging Face model first
+    if sentiment_pipeline is not None:
+        try:
+            results = sentiment_pipeline(
+                texts, batch_size=batch_size, truncation=True, max_length=512
+            )
+            return [_to_sentiment_data(result) for result in results]
 
         except Exception as e:
             logger.warning(f"Hugging Face analysis failed, using fallback: {e}")
-            sentiment_data = _fallback_sentiment_textblob(text)
     else:
         # Use TextBlob fallback
         logger.info("Using TextBlob fallback for sentiment analysis")
-        sentiment_data = _fallback_sentiment_textblob(text)
-
-    # Detect emotions
-    # Try model-based detection first
-    emotions = _detect_emotions_with_model(text)
-
-    # If model fails or returns nothing, use keyword-based detection
-    if not emotions:
-        emotions = _detect_emotions_from_keywords(text, sentiment_data['label'])
 
-    # Extract keywords
-    keywords = _extract_keywords(text)
-
-    # Combine all results
-    return {
-        'label': sentiment_data['label'],
-        'score': sentiment_data['score'],
-        'confidence': sentiment_data['confidence'],
-        'emotions': emotions,
-        'keywords': keywords
-    }
-
-
-def get_mood_emoji(sentiment_score: float) -> str:
-    """
-    Get emoji representation of mood based on sentiment score
-
-    Args:
-        sentiment_score: Sentiment score (-1 to 1)
-
-    Returns:
-        Emoji string
-    """
-    if sentiment_score > 0.5:
-        return "😄"
-    elif sentiment_score > 0.3:
-        return "😊"
-    elif sentiment_score > -0.3:
-        return "😐"
-    elif sentiment_score > -0.5:
-        return "😢"
-    else:
-        return "😭"
+    return [_fallback_sentiment_textblob(text) for text in texts]
 
 
-def get_mood_color(sentiment_score: float) -> str:
+def analyze_sentiment_batch(texts: List[str], batch_size: int = 32) -> List[Dict]:
     """
-    Get color code for mood based on sentiment score
+    Analyze sentiment of several journal entries with batched model calls
 
     Args:
-        sentiment_score: Sentiment score (-1 to 1)
+        texts: Journal entry texts
+        batch_size: Number of texts per model forward pass
 
     Returns:
-        Hex color code
+        List of sentiment analysis results, in the same order as texts
     """
-    if sentiment_score > 0.3:
-        return "#4CAF50"  # Green
-    elif sentiment_score < -0.3:
-        return "#F44336"  # Red
+    # The two models use different tokenizers and encoders, so they can't
+    # share a forward pass. Large batches run emotion detection alongside
+    # sentiment, smaller ones run the models one after the other
+    if len(texts) >= _CONCURRENT_MIN_TEXTS:
+        emotions_future = _emotion_executor.submit(_detect_emotions_with_model, texts, batch_size)
+        sentiments = _detect_sentiments(texts, batch_size)
+        model_emotions = emotions_future.result()
     else:
-        return "#FFC107"  # Yellow
+        sentiments = _detect_sentiments(texts, batch_size)
+        model_emotions = _detect_emotions_with_model(texts, batch_size)
+
+    analyses = []
+    for text, sentiment_data, emotions in zip(texts, sentiments, model_emotions):
+        # If model fails or returns nothing, use keyword-based detection
+        if not emotions:
+            emotions = _detect_emotions_from_keywords(text, sentiment_data['label'])
+
+        # Combine all results
+        analyses.append({
+            'label': sentiment_data['label'],
+            'score': sentiment_data['score'],
+            'confidence': sentiment_data['confidence'],
+            'emotions': emotions,
+            'keywords': extract_keywords(text)
+        })
+
+    return analyses
@@ -5,46 +5,24 @@ Uses TextBlob for stability - no heavy ML models
 
 import logging
 from typing import Dict, List
-import re
-from collections import Counter
+
+# get_mood_emoji and get_mood_color are re-exported for existing callers
+from utils.mood import extract_keywords, get_mood_color, get_mood_emoji  # noqa: F401
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-def _extract_keywords(text: str, top_n: int = 5) -> List[str]:
-    """
-    Extract top keywords from text
-
-    Args:
-        text: Text to analyze
-        top_n: Number of keywords to extract
-
-    Returns:
-        List of keywords
-    """
-    # Common stop words to exclude
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-        'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'can', 'i', 'you', 'he', 'she',
-        'it', 'we', 'they', 'my', 'your', 'his', 'her', 'its', 'our', 'their',
-        'this', 'that', 'these', 'those', 'am', 'me', 'just', 'so', 'very',
-        'really', 'too', 'much', 'more', 'most', 'some', 'any', 'all', 'both',
-        'each', 'few', 'many', 'other', 'such', 'no', 'not', 'only', 'own',
-        'same', 'than', 'then', 'there', 'when', 'where', 'why', 'how'
-    }
-
-    # Clean and tokenize text
-    words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-
-    # Filter stop words and count
-    filtered_words = [w for w in words if w not in stop_words]
-    word_counts = Counter(filtered_words)
-
-    # Return top N keywords
-    return [word for word, _ in word_counts.most_common(top_n)]
+# Keywords that signal each emotion, matched as substrings of the lowercased text
+_EMOTION_KEYWORDS = {
+    'joy': ['happy', 'joy', 'excited', 'wonderful', 'amazing', 'great', 'love', 'fantastic', 'delighted', 'thrilled'],
+    'sadness': ['sad', 'depressed', 'unhappy', 'down', 'crying', 'tears', 'lonely', 'miss', 'disappointed', 'heartbroken'],
+    'anger': ['angry', 'mad', 'furious', 'annoyed', 'frustrated', 'irritated', 'hate', 'rage', 'outraged'],
+    'fear': ['afraid', 'scared', 'anxious', 'worried', 'nervous', 'panic', 'terrified', 'frightened'],
+    'surprise': ['surprised', 'shocked', 'amazed', 'unexpected', 'sudden', 'wow', 'astonished'],
+    'gratitude': ['grateful', 'thankful', 'appreciate', 'blessed', 'lucky', 'fortunate', 'thanks'],
+    'hope': ['hope', 'optimistic', 'looking forward', 'excited about', 'can\'t wait', 'hopeful'],
+    'stress': ['stressed', 'overwhelmed', 'pressure', 'burden', 'exhausted', 'tired', 'burned out']
+}
 
 
 def _detect_emotions_from_keywords(text: str, sentiment_label: str) -> List[str]:
@@ -60,21 +38,10 @@ def _detect_emotions_from_keywords(text: str, sentiment_label: str) -> List[str]
     """
     text_lower = text.lower()
 
-    emotion_keywords = {
-        'joy': ['happy', 'joy', 'excited', 'wonderful', 'amazing', 'great', 'love', 'fantastic', 'delighted', 'thrilled'],
-        'sadness': ['sad', 'depressed', 'unhappy', 'down', 'crying', 'tears', 'lonely', 'miss', 'disappointed', 'heartbroken'],
-        'anger': ['angry', 'mad', 'furious', 'annoyed', 'frustrated', 'irritated', 'hate', 'rage', 'outraged'],
-        'fear': ['afraid', 'scared', 'anxious', 'worried', 'nervous', 'panic', 'terrified', 'frightened'],
-        'surprise': ['surprised', 'shocked', 'amazed', 'unexpected', 'sudden', 'wow', 'astonished'],
-        'gratitude': ['grateful', 'thankful', 'appreciate', 'blessed', 'lucky', 'fortunate', 'thanks'],
-        'hope': ['hope', 'optimistic', 'looking forward', 'excited about', 'can\'t wait', 'hopeful'],
-        'stress': ['stressed', 'overwhelmed', 'pressure', 'burden', 'exhausted', 'tired', 'burned out']
-    }
-
     detected = []
     emotion_scores = {}
 
-    for emotion, keywords in emotion_keywords.items():
+    for emotion, keywords in _EMOTION_KEYWORDS.items():
         count = sum(1 for keyword in keywords if keyword in text_lower)
         if count > 0:
             emotion_scores[emotion] = count
@@ -126,7 +93,7 @@ def analyze_sentiment(text: str) -> Dict:
         emotions = _detect_emotions_from_keywords(text, label)
 
         # Extract keywords
-        keywords = _extract_keywords(text)
+        keywords = extract_keywords(text)
 
         logger.info(f"Sentiment analysis: {label} (score: {polarity:.2f})")
 
@@ -146,7 +113,7 @@ def analyze_sentiment(text: str) -> Dict:
             'score': 0.0,
             'confidence': 0.0,
             'emotions': ['neutral'],
-            'keywords': _extract_keywords(text)
+            'keywords': extract_keywords(text)
         }
     except Exception as e:
         logger.error(f"Sentiment analysis error: {e}")
@@ -155,45 +122,30 @@ def analyze_sentiment(text: str) -> Dict:
             'score': 0.0,
             'confidence': 0.0,
             'emotions': ['neutral'],
-            'keywords': _extract_keywords(text)
+            'keywords': extract_keywords(text)
         }
 
 
-def get_mood_emoji(sentiment_score: float) -> str:
+def warm_up() -> None:
+    """
+    Import TextBlob and run one tiny analysis so the first real entry
+    does not pay the startup cost
     """
-    Get emoji representation of mood based on sentiment score
+    try:
+        from textblob import TextBlob
+        TextBlob("warm up").sentiment
+    except Exception as e:
+        logger.warning(f"Sentiment analyzer warm-up failed: {e}")
 
-    Args:
-        sentiment_score: Sentiment score (-1 to 1)
 
-    Returns:
-        Emoji string
-    """
-    if sentiment_score > 0.5:
-        return "😄"
-    elif sentiment_score > 0.3:
-        return "😊"
-    elif sentiment_score > -0.3:
-        return "😐"
-    elif sentiment_score > -0.5:
-        return "😢"
-    else:
-        return "😭"
-
-
-def get_mood_color(sentiment_score: float) -> str:
+def analyze_sentiment_batch(texts: List[str]) -> List[Dict]:
     """
-    Get color code for mood based on sentiment score
+    Analyze sentiment of several journal entries in one call
 
     Args:
-        sentiment_score: Sentiment score (-1 to 1)
+        texts: Journal entry texts
 
     Returns:
-        Hex color code
+        List of sentiment analysis results, in the same order as texts
     """
-    if sentiment_score > 0.3:
-        return "#4CAF50"  # Green
-    elif sentiment_score < -0.3:
-        return "#F44336"  # Red
-    else:
-        return "#FFC107"  # Yellow
+    return [analyze_sentiment(text) for text in texts]
@@ -3,21 +3,31 @@ Visualizations for Emotional Journal MVP
 Creates interactive charts using Plotly and word clouds
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-from collections import Counter
-from typing import Dict, List
+import plotly.io as pio
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 import io
 import base64
+from collections import Counter
 from datetime import datetime, timedelta
 import logging
+import re
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# st.plotly_chart serializes every figure with plotly.io.to_json on each
+# rerun, use the orjson engine for it when orjson is installed
+try:
+    import orjson  # noqa: F401
+
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
 # Color scheme
 COLORS = {
     'positive': '#4CAF50',  # Green
@@ -28,76 +38,258 @@ COLORS = {
     'text': '#2C3E50'       # Dark blue-gray
 }
 
+# Plotly's qualitative Pastel palette, inlined to avoid importing plotly.express
+PASTEL_COLORS = [
+    'rgb(102, 197, 204)', 'rgb(246, 207, 113)', 'rgb(248, 156, 116)', 'rgb(220, 176, 242)',
+    'rgb(135, 197, 95)', 'rgb(158, 185, 243)', 'rgb(254, 136, 177)', 'rgb(201, 219, 116)',
+    'rgb(139, 224, 164)', 'rgb(180, 151, 231)', 'rgb(179, 179, 179)'
+]
+
+# Words for the word cloud, lowercase letters and apostrophes
+_WORD_RE = re.compile(r"[a-z']{3,}")
 
-def create_mood_trend_chart(df: pd.DataFrame, days: int = None) -> go.Figure:
+# Characters of entry text the word cloud reads, newest entries first
+_WORD_CLOUD_MAX_CHARS = 200_000
+
+
+@dataclass(frozen=True)
+class PreparedJournal:
     """
-    Create mood trend line chart
+    Journal entries as column arrays sorted by timestamp, prepared once and
+    shared by all chart functions
+    """
+    ts: np.ndarray        # datetime64[ns]
+    score: np.ndarray     # float64
+    label: np.ndarray
+    text: np.ndarray
+    emotions: np.ndarray  # lists of emotion names
+    dow: np.ndarray       # weekday, Monday is 0
+    date: np.ndarray      # datetime64[D]
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.ts) == 0
+
+
+def prepare_journal(df: pd.DataFrame) -> PreparedJournal:
+    """
+    Extract the columns the charts need from a journal DataFrame
 
     Args:
         df: DataFrame with journal entries
-        days: Number of days to show (None for all)
 
     Returns:
-        Plotly Figure object
+        PreparedJournal sorted by timestamp, with read-only arrays
     """
     if df.empty:
-        # Return empty chart with message
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available yet. Start journaling to see your mood trends!",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14, color=COLORS['text'])
-        )
-        fig.update_layout(
-            title="Mood Trend Over Time",
-            height=400,
-            plot_bgcolor='white'
+        ts = np.empty(0, dtype='datetime64[ns]')
+        order = np.empty(0, dtype=np.int64)
+        score = np.empty(0, dtype=np.float64)
+        label = text = emotions = np.empty(0, dtype=object)
+    else:
+        ts = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+        order = np.argsort(ts, kind='stable')
+        score = df['ai_sentiment_score'].to_numpy(dtype=np.float64)
+        label = df['ai_sentiment_label'].to_numpy(dtype=object)
+        text = df['entry_text'].to_numpy(dtype=object)
+        emotions = df['detected_emotions'].to_numpy(dtype=object)
+
+    ts = ts[order]
+    days = ts.astype('datetime64[D]')
+    columns = dict(
+        ts=ts,
+        score=score[order],
+        label=label[order],
+        text=text[order],
+        emotions=emotions[order],
+        # 1970-01-01 was a Thursday
+        dow=(days.view(np.int64) + 3) % 7,
+        date=days
+    )
+
+    # Prepared journals are shared between charts and callers
+    for values in columns.values():
+        values.setflags(write=False)
+
+    return PreparedJournal(**columns)
+
+
+def _as_journal(data: Union[pd.DataFrame, PreparedJournal]) -> PreparedJournal:
+    """Prepare a journal DataFrame, passing prepared journals through"""
+    if isinstance(data, PreparedJournal):
+        return data
+    return prepare_journal(data)
+
+
+# Mood trends longer than the threshold are downsampled to at most this many points
+_TREND_DOWNSAMPLE_THRESHOLD = 2000
+_TREND_MAX_POINTS = 1000
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick points to keep with Largest-Triangle-Three-Buckets downsampling
+
+    Args:
+        x: Sorted x values
+        y: y values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted indices of the kept points, always including the first and last
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Interior points split into n_out - 2 buckets, one point kept per bucket
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Average of the next bucket (the last point for the final bucket)
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i < n_out - 3 else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Keep the point forming the largest triangle with the previous
+        # kept point and the next bucket's average
+        areas = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected]) -
+            (x[selected] - x[start:end]) * (avg_y - y[selected])
         )
-        return fig
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
 
-    # Filter by days if specified
-    if days:
-        cutoff_date = datetime.now() - timedelta(days=days)
-        df = df[df['timestamp'] >= cutoff_date]
+    return indices
 
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text=f"No entries in the last {days} days",
+
+def _first_index_since(ts: np.ndarray, cutoff: datetime) -> int:
+    """
+    Find where entries at or after a cutoff start
+
+    Args:
+        ts: Sorted datetime64[ns] timestamps
+        cutoff: Earliest time to keep
+
+    Returns:
+        Index of the first timestamp >= cutoff
+    """
+    return int(np.searchsorted(ts.view(np.int64), np.datetime64(cutoff, 'ns').astype(np.int64)))
+
+
+def _sentiment_colors(scores: np.ndarray) -> np.ndarray:
+    """
+    Map sentiment scores to positive/neutral/negative colors
+
+    Args:
+        scores: Sentiment scores (-1 to 1)
+
+    Returns:
+        Array of hex color codes
+    """
+    return np.select(
+        [scores > 0.3, scores < -0.3],
+        [COLORS['positive'], COLORS['negative']],
+        default=COLORS['neutral']
+    )
+
+
+def _empty_fig(title: str, message: str = "No data available",
+               render_empty: bool = True) -> Optional[go.Figure]:
+    """
+    Placeholder chart shown when there is nothing to plot
+
+    Args:
+        title: Chart title
+        message: Message shown in the middle of the chart
+        render_empty: Build the figure, otherwise return None
+
+    Returns:
+        Plotly Figure object, or None if render_empty is False
+    """
+    if not render_empty:
+        return None
+
+    return go.Figure(layout=dict(
+        title=title,
+        height=400,
+        annotations=[dict(
+            text=message,
             xref="paper", yref="paper",
             x=0.5, y=0.5, showarrow=False,
             font=dict(size=14, color=COLORS['text'])
+        )]
+    ))
+
+
+def create_mood_trend_chart(journal: Union[pd.DataFrame, PreparedJournal], days: int = None,
+                            render_empty: bool = True) -> Optional[go.Figure]:
+    """
+    Create mood trend line chart
+
+    Args:
+        journal: Journal entries, as a DataFrame or PreparedJournal
+        days: Number of days to show (None for all)
+        render_empty: Build a placeholder figure when there is nothing to plot,
+            otherwise return None so the caller can show its own message
+
+    Returns:
+        Plotly Figure object, or None
+    """
+    journal = _as_journal(journal)
+
+    if journal.empty:
+        # Return empty chart with message
+        return _empty_fig(
+            "Mood Trend Over Time",
+            "No data available yet. Start journaling to see your mood trends!",
+            render_empty
         )
-        fig.update_layout(title="Mood Trend Over Time", height=400)
-        return fig
 
-    # Sort by timestamp
-    df = df.sort_values('timestamp')
+    ts, score = journal.ts, journal.score
+    label, text = journal.label, journal.text
+
+    # Filter by days if specified, slicing the sorted arrays
+    if days:
+        start = _first_index_since(ts, datetime.now() - timedelta(days=days))
+        ts, score, label, text = ts[start:], score[start:], label[start:], text[start:]
+
+    if ts.size == 0:
+        return _empty_fig("Mood Trend Over Time", f"No entries in the last {days} days", render_empty)
+
+    # Long histories are downsampled, the browser can't show more points
+    if ts.size > _TREND_DOWNSAMPLE_THRESHOLD:
+        x = ts.astype('datetime64[s]').astype(np.float64)
+        keep = _lttb_indices(x, score, _TREND_MAX_POINTS)
+        ts, score, label, text = ts[keep], score[keep], label[keep], text[keep]
 
     # Create color gradient based on sentiment
-    colors = df['ai_sentiment_score'].apply(lambda x:
-        COLORS['positive'] if x > 0.3 else
-        COLORS['negative'] if x < -0.3 else
-        COLORS['neutral']
-    )
+    colors = _sentiment_colors(score)
 
     # Create hover text
-    df['hover_text'] = df.apply(lambda row:
-        f"Date: {row['timestamp'].strftime('%Y-%m-%d %H:%M')}<br>" +
-        f"Mood Score: {row['ai_sentiment_score']:.2f}<br>" +
-        f"Sentiment: {row['ai_sentiment_label']}<br>" +
-        f"Preview: {row['entry_text'][:100]}...",
-        axis=1
+    hover_text = (
+        "Date: " + pd.Series(ts).dt.strftime('%Y-%m-%d %H:%M') +
+        "<br>Mood Score: " + pd.Series(score).map('{:.2f}'.format) +
+        "<br>Sentiment: " + pd.Series(label).astype(str) +
+        "<br>Preview: " + pd.Series(text).str.slice(0, 100) + "..."
     )
 
     # Create figure
     fig = go.Figure()
 
     # Add line
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=df['ai_sentiment_score'],
+    fig.add_trace(go.Scattergl(
+        x=ts,
+        y=score,
         mode='lines+markers',
         name='Mood Score',
         line=dict(color=COLORS['primary'], width=2),
@@ -106,7 +298,7 @@ def create_mood_trend_chart(df: pd.DataFrame, days: int = None) -> go.Figure:
             color=colors,
             line=dict(width=2, color='white')
         ),
-        hovertext=df['hover_text'],
+        hovertext=hover_text,
         hoverinfo='text'
     ))
 
@@ -116,8 +308,11 @@ def create_mood_trend_chart(df: pd.DataFrame, days: int = None) -> go.Figure:
     fig.add_hline(y=-0.3, line_dash="dot", line_color=COLORS['negative'], opacity=0.3)
 
     # Update layout
+    # uirevision keeps the user's zoom and legend state across reruns, a
+    # different time range starts from a fresh view
     fig.update_layout(
         title="Mood Trend Over Time",
+        uirevision=f"mood_trend_{days}",
         xaxis_title="Date",
         yaxis_title="Mood Score",
         height=400,
@@ -131,60 +326,64 @@ def create_mood_trend_chart(df: pd.DataFrame, days: int = None) -> go.Figure:
     return fig
 
 
-def create_emotion_distribution_chart(df: pd.DataFrame) -> go.Figure:
+def _count_emotions_newest_first(journal: PreparedJournal) -> pd.Series:
+    """
+    Count emotions across entries in the order they first appear, newest
+    entry first, so ties go to the most recent emotion like
+    Counter.most_common over the newest-first entries did
+
+    Args:
+        journal: Prepared journal entries
+
+    Returns:
+        Series of counts indexed by emotion, unsorted
+    """
+    return pd.Series(journal.emotions[::-1]).explode().dropna().value_counts(sort=False)
+
+
+def create_emotion_distribution_chart(journal: Union[pd.DataFrame, PreparedJournal],
+                                      render_empty: bool = True) -> Optional[go.Figure]:
     """
     Create emotion distribution pie chart
 
     Args:
-        df: DataFrame with journal entries
+        journal: Journal entries, as a DataFrame or PreparedJournal
+        render_empty: Build a placeholder figure when there is nothing to plot,
+            otherwise return None
 
     Returns:
-        Plotly Figure object
+        Plotly Figure object, or None
     """
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No emotion data available yet",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14, color=COLORS['text'])
-        )
-        fig.update_layout(title="Emotion Distribution", height=400)
-        return fig
-
-    # Collect all emotions
-    all_emotions = []
-    for emotions in df['detected_emotions']:
-        if emotions:
-            all_emotions.extend(emotions)
-
-    if not all_emotions:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No emotions detected yet",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14, color=COLORS['text'])
-        )
-        fig.update_layout(title="Emotion Distribution", height=400)
-        return fig
+    journal = _as_journal(journal)
+
+    if journal.empty:
+        return _empty_fig("Emotion Distribution", "No emotion data available yet", render_empty)
 
-    # Count emotions
-    emotion_counts = Counter(all_emotions)
-    top_emotions = dict(emotion_counts.most_common(5))
+    # Count emotions newest entry first, so ties go to the most recent emotion
+    emotion_counts = _count_emotions_newest_first(journal)
+
+    if emotion_counts.empty:
+        return _empty_fig("Emotion Distribution", "No emotions detected yet", render_empty)
+
+    # Top 5 without sorting every count. nlargest keeps the first-seen
+    # emotions on ties but can return them out of order, so the 5 are put
+    # back in first-seen order and sorted by count
+    top_emotions = emotion_counts[emotion_counts.index.isin(emotion_counts.nlargest(5, keep='first').index)]
+    top_emotions = top_emotions.sort_values(ascending=False, kind='stable')
 
     # Create pie chart
     fig = go.Figure(data=[go.Pie(
-        labels=list(top_emotions.keys()),
-        values=list(top_emotions.values()),
+        labels=top_emotions.index.to_numpy(),
+        values=top_emotions.to_numpy(),
         hole=0.3,
-        marker=dict(colors=px.colors.qualitative.Pastel),
+        marker=dict(colors=PASTEL_COLORS),
         textinfo='label+percent',
         hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
     )])
 
     fig.update_layout(
         title="Top 5 Emotions",
+        uirevision="emotion_distribution",
         height=400,
         font=dict(color=COLORS['text'])
     )
@@ -192,23 +391,56 @@ def create_emotion_distribution_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def create_word_cloud(df: pd.DataFrame) -> str:
+def _capped_texts(texts: Iterable[str], cap: int) -> Iterator[str]:
+    """
+    Yield texts until their combined length (with separators) reaches a cap
+
+    Args:
+        texts: Entry texts
+        cap: Maximum number of characters to yield
+
+    Returns:
+        Iterator of texts, the last one truncated to fit the cap
+    """
+    total = 0
+    for text in texts:
+        if not text:
+            continue
+        total += len(text) + 1
+        if total > cap:
+            yield text[:max(0, len(text) - (total - cap))]
+            return
+        yield text
+
+
+def create_word_cloud(journal: Union[pd.DataFrame, PreparedJournal]) -> Optional[str]:
     """
     Create word cloud from journal entries
 
     Args:
-        df: DataFrame with journal entries
+        journal: Journal entries, as a DataFrame or PreparedJournal
 
     Returns:
-        Base64 encoded image string for display in Streamlit
+        Base64 encoded image string for display in Streamlit, or None
     """
-    if df.empty:
+    journal = _as_journal(journal)
+
+    if journal.empty:
         return None
 
-    # Combine all entry texts
-    all_text = ' '.join(df['entry_text'].tolist())
+    # Imported here, wordcloud and its font data are only needed for this chart
+    from wordcloud import STOPWORDS, WordCloud
+
+    # Combine entry texts, newest first, up to the character cap
+    all_text = ' '.join(_capped_texts(journal.text[::-1], _WORD_CLOUD_MAX_CHARS))
+
+    # Count words once instead of letting WordCloud re-tokenize the text
+    word_counts = Counter(
+        word for word in (token.strip("'") for token in _WORD_RE.findall(all_text.lower()))
+        if len(word) >= 3 and word not in STOPWORDS
+    )
 
-    if not all_text.strip():
+    if not word_counts:
         return None
 
     try:
@@ -221,72 +453,63 @@ def create_word_cloud(df: pd.DataFrame) -> str:
             max_words=50,
             relative_scaling=0.5,
             min_font_size=10
-        ).generate(all_text)
+        ).generate_from_frequencies(word_counts)
 
-        # Convert to image
-        plt.figure(figsize=(10, 5))
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.axis('off')
-        plt.tight_layout(pad=0)
-
-        # Save to buffer
+        # Save the rendered PIL image straight to PNG, fast compression
+        # matters more than size for an inline image
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', dpi=100)
-        buf.seek(0)
-        plt.close()
+        wordcloud.to_image().save(buf, format='PNG', compress_level=1)
 
         # Encode to base64
-        img_base64 = base64.b64encode(buf.read()).decode()
-        return img_base64
+        return base64.b64encode(buf.getvalue()).decode()
 
     except Exception as e:
         logger.error(f"Word cloud generation failed: {e}")
         return None
 
 
-def create_day_of_week_chart(df: pd.DataFrame) -> go.Figure:
+def create_day_of_week_chart(journal: Union[pd.DataFrame, PreparedJournal],
+                             render_empty: bool = True) -> Optional[go.Figure]:
     """
     Create bar chart showing average mood by day of week
 
     Args:
-        df: DataFrame with journal entries
+        journal: Journal entries, as a DataFrame or PreparedJournal
+        render_empty: Build a placeholder figure when there is nothing to plot,
+            otherwise return None
 
     Returns:
-        Plotly Figure object
+        Plotly Figure object, or None
     """
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14, color=COLORS['text'])
-        )
-        fig.update_layout(title="Mood by Day of Week", height=400)
-        return fig
+    journal = _as_journal(journal)
 
-    # Add day of week
-    df['day_of_week'] = df['timestamp'].dt.day_name()
+    if journal.empty:
+        return _empty_fig("Mood by Day of Week", render_empty=render_empty)
 
     # Calculate average mood by day
     day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    mood_by_day = df.groupby('day_of_week')['ai_sentiment_score'].mean().reindex(day_order)
+    # Sum and count scores per weekday, days without scored entries stay NaN
+    scored = ~np.isnan(journal.score)
+    dow = journal.dow[scored]
+    sums = np.bincount(dow, weights=journal.score[scored], minlength=7)
+    counts = np.bincount(dow, minlength=7)
+    mood_by_day = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
 
     # Create bar chart
-    colors_map = [COLORS['positive'] if x > 0.3 else COLORS['negative'] if x < -0.3
-                  else COLORS['neutral'] for x in mood_by_day.values]
+    colors_map = _sentiment_colors(mood_by_day)
 
     fig = go.Figure(data=[go.Bar(
-        x=mood_by_day.index,
-        y=mood_by_day.values,
+        x=day_order,
+        y=mood_by_day,
         marker_color=colors_map,
-        text=[f"{val:.2f}" for val in mood_by_day.values],
+        text=np.char.mod('%.2f', mood_by_day),
         textposition='outside',
         hovertemplate='<b>%{x}</b><br>Average Mood: %{y:.2f}<extra></extra>'
     )])
 
     fig.update_layout(
         title="Average Mood by Day of Week",
+        uirevision="day_of_week",
         xaxis_title="Day",
         yaxis_title="Average Mood Score",
         height=400,
@@ -298,29 +521,26 @@ def create_day_of_week_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def create_sentiment_distribution_chart(df: pd.DataFrame) -> go.Figure:
+def create_sentiment_distribution_chart(journal: Union[pd.DataFrame, PreparedJournal],
+                                        render_empty: bool = True) -> Optional[go.Figure]:
     """
     Create bar chart showing distribution of sentiment labels
 
     Args:
-        df: DataFrame with journal entries
+        journal: Journal entries, as a DataFrame or PreparedJournal
+        render_empty: Build a placeholder figure when there is nothing to plot,
+            otherwise return None
 
     Returns:
-        Plotly Figure object
+        Plotly Figure object, or None
     """
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14, color=COLORS['text'])
-        )
-        fig.update_layout(title="Sentiment Distribution", height=400)
-        return fig
+    journal = _as_journal(journal)
+
+    if journal.empty:
+        return _empty_fig("Sentiment Distribution", render_empty=render_empty)
 
     # Count sentiment labels
-    sentiment_counts = df['ai_sentiment_label'].value_counts()
+    sentiment_counts = pd.Series(journal.label).value_counts()
 
     # Define colors
     color_map = {
@@ -335,13 +555,14 @@ def create_sentiment_distribution_chart(df: pd.DataFrame) -> go.Figure:
         x=sentiment_counts.index,
         y=sentiment_counts.values,
         marker_color=colors_list,
-        text=sentiment_counts.values,
+        text=sentiment_counts.values.astype(str) if not sentiment_counts.empty else None,
         textposition='outside',
         hovertemplate='<b>%{x}</b><br>Count: %{y}<extra></extra>'
     )])
 
     fig.update_layout(
         title="Sentiment Distribution",
+        uirevision="sentiment_distribution",
         xaxis_title="Sentiment",
         yaxis_title="Number of Entries",
         height=400,
@@ -352,17 +573,19 @@ def create_sentiment_distribution_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def get_summary_stats(df: pd.DataFrame) -> Dict:
+def get_summary_stats(journal: Union[pd.DataFrame, PreparedJournal]) -> Dict:
     """
     Calculate summary statistics for dashboard
 
     Args:
-        df: DataFrame with journal entries
+        journal: Journal entries, as a DataFrame or PreparedJournal
 
     Returns:
         Dictionary with statistics
     """
-    if df.empty:
+    journal = _as_journal(journal)
+
+    if journal.empty:
         return {
             'total_entries': 0,
             'current_streak': 0,
@@ -371,23 +594,19 @@ def get_summary_stats(df: pd.DataFrame) -> Dict:
         }
 
     # Total entries
-    total_entries = len(df)
+    total_entries = len(journal)
 
     # Current streak
-    current_streak = calculate_current_streak(df)
+    current_streak = calculate_current_streak(journal)
 
     # Average mood (last 7 days)
     now = datetime.now()
-    df_7d = df[df['timestamp'] >= now - timedelta(days=7)]
-    avg_mood_7d = df_7d['ai_sentiment_score'].mean() if not df_7d.empty else 0
+    score_7d = pd.Series(journal.score[_first_index_since(journal.ts, now - timedelta(days=7)):])
+    avg_mood_7d = score_7d.mean() if not score_7d.empty else 0
 
     # Top emotion
-    all_emotions = []
-    for emotions in df['detected_emotions']:
-        if emotions:
-            all_emotions.extend(emotions)
-
-    top_emotion = Counter(all_emotions).most_common(1)[0][0] if all_emotions else 'None'
+    emotion_counts = _count_emotions_newest_first(journal)
+    top_emotion = emotion_counts.idxmax() if not emotion_counts.empty else 'None'
 
     return {
         'total_entries': total_entries,
@@ -397,96 +616,101 @@ def get_summary_stats(df: pd.DataFrame) -> Dict:
     }
 
 
-def calculate_current_streak(df: pd.DataFrame) -> int:
+def calculate_current_streak(journal: Union[pd.DataFrame, PreparedJournal]) -> int:
     """
     Calculate current journaling streak
 
     Args:
-        df: DataFrame with journal entries
+        journal: Journal entries, as a DataFrame or PreparedJournal
 
     Returns:
         Current streak in days
     """
-    if df.empty:
-        return 0
-
-    # Get unique dates
-    dates = sorted(df['timestamp'].dt.date.unique(), reverse=True)
+    journal = _as_journal(journal)
 
-    if not dates:
+    if journal.empty:
         return 0
 
+    # Days since the epoch, already sorted ascending in the prepared journal
+    days = journal.date.view(np.int64)
+
     # Check if there's an entry today or yesterday
-    today = datetime.now().date()
-    yesterday = today - timedelta(days=1)
+    today = np.datetime64(datetime.now().date(), 'D').astype(np.int64)
 
-    if dates[0] != today and dates[0] != yesterday:
+    if days[-1] != today and days[-1] != today - 1:
         return 0
 
-    # Count consecutive days
-    streak = 1
-    for i in range(len(dates) - 1):
-        if (dates[i] - dates[i + 1]).days == 1:
-            streak += 1
-        else:
-            break
+    # Steps between entries are 0 on the same day and 1 on consecutive days,
+    # the streak is the run of distinct days after the last larger gap
+    steps = np.diff(days)
+    gaps = np.flatnonzero(steps > 1)
+    start = gaps[-1] + 1 if gaps.size else 0
 
-    return streak
+    return int(np.count_nonzero(steps[start:] == 1)) + 1
 
 
-def create_calendar_heatmap(df: pd.DataFrame, year: int = None, month: int = None) -> go.Figure:
+def create_calendar_heatmap(journal: Union[pd.DataFrame, PreparedJournal], year: int = None, month: int = None,
+                            render_empty: bool = True) -> Optional[go.Figure]:
     """
     Create calendar heatmap showing journaling activity
 
     Args:
-        df: DataFrame with journal entries
+        journal: Journal entries, as a DataFrame or PreparedJournal
         year: Year to display (default: current year)
         month: Month to display (None for full year)
+        render_empty: Build a placeholder figure when there is nothing to plot,
+            otherwise return None
 
     Returns:
-        Plotly Figure object
+        Plotly Figure object, or None
     """
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
-        fig.update_layout(title="Activity Calendar", height=400)
-        return fig
+    journal = _as_journal(journal)
+
+    if journal.empty:
+        return _empty_fig("Activity Calendar", render_empty=render_empty)
 
     # Use current year if not specified
     if year is None:
         year = datetime.now().year
 
-    # Group by date and count entries
-    df['date'] = df['timestamp'].dt.date
-    daily_counts = df.groupby('date').size().reset_index(name='count')
+    # Keep the days in the requested year or month (the days are sorted)
+    if month is None:
+        period = str(year)
+        start, end = np.datetime64(f"{year}-01-01", 'D'), np.datetime64(f"{year + 1}-01-01", 'D')
+    else:
+        period = f"{year}-{month:02d}"
+        start = np.datetime64(period, 'M')
+        start, end = start.astype('datetime64[D]'), (start + 1).astype('datetime64[D]')
+
+    lo, hi = np.searchsorted(journal.date, [start, end])
+    if lo == hi:
+        return _empty_fig(f"Journaling Activity - {period}", f"No entries in {period}", render_empty)
+
+    # Count entries per date
+    days, counts = np.unique(journal.date[lo:hi], return_counts=True)
 
     # Create hover text
-    daily_counts['hover_text'] = daily_counts.apply(
-        lambda row: f"{row['date']}<br>Entries: {row['count']}", axis=1
-    )
+    hover_text = [f"{day}<br>Entries: {count}" for day, count in zip(days, counts)]
 
     # Create scatter plot (simplified calendar view)
-    fig = go.Figure(data=[go.Scatter(
-        x=pd.to_datetime(daily_counts['date']),
-        y=[1] * len(daily_counts),
+    fig = go.Figure(data=[go.Scattergl(
+        x=days,
+        y=np.ones_like(counts),
         mode='markers',
         marker=dict(
-            size=daily_counts['count'] * 10,
-            color=daily_counts['count'],
+            size=counts * 10,
+            color=counts,
             colorscale='Greens',
             showscale=True,
             colorbar=dict(title="Entries")
         ),
-        hovertext=daily_counts['hover_text'],
+        hovertext=hover_text,
         hoverinfo='text'
     )])
 
     fig.update_layout(
-        title=f"Journaling Activity - {year}",
+        title=f"Journaling Activity - {period}",
+        uirevision=f"calendar_{period}",
         height=200,
         yaxis=dict(visible=False),
         xaxis=dict(title="Date"),